@@ -2,12 +2,22 @@
 import argparse
 import csv
 import hashlib
+import io
 import json
 import math
+import queue
 import re
+import statistics
 import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate, islice, pairwise
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator, Sequence, Set, Union
 
 import pdfplumber
 
@@ -17,10 +27,22 @@ SECTION_HEADER_RE = re.compile(
     r"^(?!.*(?:\.\s*){3,})\s*(?:SECTION\s+)?([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b(?:\s+(.*))?$",
     re.IGNORECASE,
 )
+# SECTION_HEADER_RE without the dot-leader look-ahead; see match_section_header.
+SECTION_HEADER_BODY_RE = re.compile(
+    r"^\s*(?:SECTION\s+)?([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b(?:\s+(.*))?$",
+    re.IGNORECASE,
+)
 SECTION_TEXT_RE = re.compile(
     r"^\s*(?:(SECTION)\s+([A-Z0-9]+)|Appendix\s+([A-Z]+)|([RNPGE]\d+(?:\.\d+)*))\s+(?:[^.]+\.[\s]*|[–—].+)$",
     re.IGNORECASE,
 )
+# Fallback section-start shapes tried when SECTION_TEXT_RE does not match.
+SECTION_ONLY_RE = re.compile(
+    r"^\s*SECTION\s+([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$", re.IGNORECASE
+)
+BARE_SECTION_ID_RE = re.compile(r"^\s*([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$", re.IGNORECASE)
+APPENDIX_HEADING_RE = re.compile(r"^\s*APPENDIX\s+([A-Z]+)\b(?:\s+(.+))?$", re.IGNORECASE)
+SECTION_WORD_RE = re.compile(r"^\s*SECTION\b", re.IGNORECASE)
 CHAPTER_RE = re.compile(r"^CHAPTER\s+([A-Z0-9]+)\b", re.IGNORECASE)
 TABLE_LABEL_RE = re.compile(
     r"^TABLE\s+([A-Z]{1,3}\d{3,4}(?:\.\d+)*(?:\([0-9A-Z]+\))?)\b\.?\s*(.*)?$",
@@ -28,6 +50,35 @@ TABLE_LABEL_RE = re.compile(
 )
 AMENDMENT_RE = re.compile(r"\b(?:UTAH|STATE|AMENDED|MODIFIED|AMENDMENTS)\b", re.IGNORECASE)
 
+# Line-classification patterns (compiled once; the predicates run per line per page).
+PAGE_REF_ALPHA_RE = re.compile(r"\b[A-Z]{1,3}-\d+\b\s*$")
+PAGE_REF_NUM_RE = re.compile(r"\b\d+\b\s*$")
+SECTION_REF_PREFIX_RE = re.compile(
+    r"^\s*(?:SECTION\s+)?[A-Z]{1,3}\d{3,4}(?:\.\d+)*\b", re.IGNORECASE
+)
+APPENDIX_REF_PREFIX_RE = re.compile(r"^\s*APPENDIX\s+[A-Z]{1,3}\b", re.IGNORECASE)
+REFERENCE_HEADER_RE = re.compile(
+    r"^\s*(SECTION|APPENDIX|TABLE|FIGURE|CHAPTER|PART)\s+\1\s*$", re.IGNORECASE
+)
+WHITESPACE_RE = re.compile(r"\s+")
+LOWERCASE_RE = re.compile(r"[a-z]")
+UPPERCASE_RE = re.compile(r"[A-Z]")
+CID_RE = re.compile(r"^\(cid:\d+\)$")
+SINGLE_UPPER_RE = re.compile(r"^[A-Z]$")
+GUTTER_ALPHA_RE = re.compile(r"^-?[A-Za-z]{1,2}$")
+ALNUM_RE = re.compile(r"[A-Za-z0-9]")
+ALPHA_RE = re.compile(r"[A-Za-z]")
+DIGIT_RE = re.compile(r"\d")
+DIGIT_RUN_RE = re.compile(r"\d+")
+NUMERIC_FRAGMENT_RE = re.compile(r"^[0-9().]+$")
+TRUE_SECTION_HEADING_RE = re.compile(
+    r"^\s*([A-Z]{1,3}\d{3,4}(?:\.\d+){0,6})\b(.*)$", re.IGNORECASE
+)
+SECTION_ID_RE = re.compile(r"[A-Z]{1,3}\d{3,4}(?:\.\d+)*", re.IGNORECASE)
+SECTION_MARKER_RE = re.compile(
+    r"^\s*SECTION\s+([A-Z]{1,3}\d{3,4}(?:\.\d+){0,6})\b", re.IGNORECASE
+)
+
 TABLE_SETTINGS = {
     "vertical_strategy": "lines",
     "horizontal_strategy": "lines",
@@ -72,11 +123,12 @@ def format_error(
     detail: str,
     stats: Optional[Dict] = None,
 ) -> str:
-    pdf_page = page_num if page_num is not None else "UNKNOWN"
-    message = f"RULE={rule} PDF_PAGE={pdf_page} detail={detail}"
+    pdf_page = str(page_num) if page_num is not None else "UNKNOWN"
+    parts = ["RULE=", rule, " PDF_PAGE=", pdf_page, " detail=", detail]
     if stats is not None:
-        message += f" stats={stats}"
-    return message
+        parts.append(" stats=")
+        parts.append(repr(stats))
+    return "".join(parts)
 
 
 def ensure_error_context(message: str, page_num: Optional[int]) -> str:
@@ -91,11 +143,7 @@ def ensure_error_context(message: str, page_num: Optional[int]) -> str:
 def median(values: List[float]) -> float:
     if not values:
         raise RuntimeError(format_error("MEDIAN_EMPTY", None, "Cannot compute median of empty list."))
-    values_sorted = sorted(values)
-    mid = len(values_sorted) // 2
-    if len(values_sorted) % 2 == 1:
-        return values_sorted[mid]
-    return (values_sorted[mid - 1] + values_sorted[mid]) / 2.0
+    return statistics.median(values)
 
 
 def percentile(values: List[float], pct: float, page_num: int, label: str) -> float:
@@ -111,6 +159,8 @@ def percentile(values: List[float], pct: float, page_num: int, label: str) -> fl
         return min(values)
     if pct >= 100:
         return max(values)
+    if pct == 50:
+        return median(values)
     values_sorted = sorted(values)
     k = (len(values_sorted) - 1) * (pct / 100.0)
     f = math.floor(k)
@@ -122,15 +172,28 @@ def percentile(values: List[float], pct: float, page_num: int, label: str) -> fl
     return d0 + d1
 
 
-def compute_char_metrics(words: List[Dict], page_num: int) -> Tuple[float, float]:
-    widths: List[float] = []
+def char_widths(words: List[Dict]) -> List[float]:
+    widths = [(w["x1"] - w["x0"]) / len(w["text"]) for w in words if w.get("text")]
+    return [width for width in widths if width > 0]
+
+
+def cache_word_heights(words: List[Dict]) -> None:
     for w in words:
-        text = w.get("text") or ""
-        if not text:
-            continue
-        width = (w["x1"] - w["x0"]) / max(len(text), 1)
-        if width > 0:
-            widths.append(width)
+        top = w.get("top", 0.0)
+        w["_height"] = w.get("bottom", top) - top
+
+
+def word_heights(words: List[Dict]) -> List[float]:
+    # Words without full vertical extents still get a height, but stay out of the median.
+    return [
+        w["_height"]
+        for w in words
+        if w.get("bottom") is not None and w.get("top") is not None
+    ]
+
+
+def compute_char_metrics(words: List[Dict], page_num: int) -> Tuple[float, float]:
+    widths = char_widths(words)
     if not widths:
         raise RuntimeError(
             format_error(
@@ -146,17 +209,16 @@ def compute_char_metrics(words: List[Dict], page_num: int) -> Tuple[float, float
 def join_words_with_spacing(
     words: List[Dict], gap_threshold: float, median_char_width: float
 ) -> str:
-    parts: List[str] = []
-    prev_x1: Optional[float] = None
-    for w in words:
-        if prev_x1 is not None:
-            gap = w["x0"] - prev_x1
-            if gap > gap_threshold:
-                # Preserve spacing deterministically using geometry-derived width.
-                count = max(1, int(round(gap / median_char_width)))
-                parts.append(" " * count)
+    if len(words) < 2:
+        return words[0]["text"] if words else ""
+    parts: List[str] = [words[0]["text"]]
+    for prev, w in zip(words, words[1:]):
+        gap = w["x0"] - prev["x1"]
+        if gap > gap_threshold:
+            # Preserve spacing deterministically using geometry-derived width.
+            count = max(1, int(round(gap / median_char_width)))
+            parts.append(" " * count)
         parts.append(w["text"])
-        prev_x1 = w["x1"]
     return "".join(parts)
 
 
@@ -166,57 +228,88 @@ def words_to_lines(
     gap_threshold: float = WORD_GAP_MIN,
     median_char_width: float = 1.0,
 ) -> List[Dict]:
-    words_sorted = sorted(words, key=lambda w: (w["top"], w["x0"]))
+    words_sorted = sorted(words, key=itemgetter("top", "x0"))
     lines: List[Dict] = []
+    current: Optional[Dict] = None
     for w in words_sorted:
-        if not lines or abs(w["top"] - lines[-1]["top"]) > y_tolerance:
-            lines.append(
-                {
-                    "top": w["top"],
-                    "bottom": w["bottom"],
-                    "x0": w["x0"],
-                    "x1": w["x1"],
-                    "words": [w],
-                }
-            )
+        # Words arrive in top order, so the difference is never negative.
+        if current is None or (w["top"] - current["top"]) > y_tolerance:
+            current = {
+                "top": w["top"],
+                "bottom": w["bottom"],
+                "x0": w["x0"],
+                "x1": w["x1"],
+                "words": [w],
+            }
+            lines.append(current)
         else:
-            lines[-1]["words"].append(w)
-            lines[-1]["x0"] = min(lines[-1]["x0"], w["x0"])
-            lines[-1]["x1"] = max(lines[-1]["x1"], w["x1"])
-            lines[-1]["bottom"] = max(lines[-1]["bottom"], w["bottom"])
+            current["words"].append(w)
+            # Same picks as min()/max(): the running value wins ties.
+            if w["x0"] < current["x0"]:
+                current["x0"] = w["x0"]
+            if w["x1"] > current["x1"]:
+                current["x1"] = w["x1"]
+            if w["bottom"] > current["bottom"]:
+                current["bottom"] = w["bottom"]
     for line in lines:
-        line["words"].sort(key=lambda w: w["x0"])
+        line["words"].sort(key=itemgetter("x0"))
         line["text"] = join_words_with_spacing(
             line["words"], gap_threshold, median_char_width
         )
+        # Cached for the per-line predicates, which each need these repeatedly.
+        line["_stripped"] = line["text"].strip()
+        line["_upper"] = line["text"].upper()
+        line["_width"] = line["x1"] - line["x0"]
+        line["_center"] = (line["x0"] + line["x1"]) / 2.0
         sizes = [w["size"] for w in line["words"] if isinstance(w.get("size"), (int, float))]
         line["size_median"] = median(sizes) if sizes else None
         line["bold"] = any("bold" in (w.get("fontname") or "").lower() for w in line["words"])
     return [l for l in lines if l["text"]]
 
 
-def is_centered_line(line: Dict, page_width: float) -> bool:
-    band_half = (page_width * CENTER_BAND_RATIO) / 2.0
-    center = page_width / 2.0
-    left = center - band_half
-    right = center + band_half
-    return line["x0"] >= left and line["x1"] <= right
+def center_band(page_width: float) -> Tuple[float, float]:
+    return page_width / 2.0, page_width * (CENTER_BAND_RATIO / 2.0)
+
+
+def is_centered_line(line: Dict, page_center: float, center_half: float) -> bool:
+    return line["x0"] >= (page_center - center_half) and line["x1"] <= (page_center + center_half)
 
 
 def has_dot_leaders(text: str) -> bool:
-    return re.search(r"(?:\.\s*){3,}", text) is not None
+    # Three or more dots separated only by whitespace, i.e. r"(?:\.\s*){3,}".
+    if text.count(".") < 3:
+        return False
+    run = 0
+    for gap in text.split(".")[1:-1]:
+        if gap and not gap.isspace():
+            run = 0
+            continue
+        run += 1
+        if run >= 2:
+            return True
+    return False
+
+
+def match_section_header(text: str) -> Optional[re.Match]:
+    # Same result as SECTION_HEADER_RE.match; the look-ahead dominates its cost, so
+    # single-line text checks dot leaders with has_dot_leaders instead.
+    if "\n" in text:
+        return SECTION_HEADER_RE.match(text)
+    if has_dot_leaders(text):
+        return None
+    return SECTION_HEADER_BODY_RE.match(text)
 
 
 def has_prose_punctuation(text: str) -> bool:
     if has_dot_leaders(text):
         return False
-    return re.search(r"[.!?;:]", text) is not None
+    return any(mark in text for mark in ".!?;:")
 
 
 def ends_with_page_reference(text: str) -> bool:
     return (
-        re.search(r"\b[A-Z]{1,3}-\d+\b\s*$", text) is not None
-        or re.search(r"\b\d+\b\s*$", text) is not None
+        PAGE_REF_ALPHA_RE.search(text) is not None
+        or PAGE_REF_NUM_RE.search(text) is not None
     )
 
 
@@ -234,26 +327,28 @@ def is_toc_reference_continuation(
     if not has_dot_leaders(next_line_text) or not ends_with_page_reference(next_line_text):
         return False
     return (
-        re.match(r"^\s*(?:SECTION\s+)?[A-Z]{1,3}\d{3,4}(?:\.\d+)*\b", line_text, re.IGNORECASE)
-        is not None
-        or re.match(r"^\s*APPENDIX\s+[A-Z]{1,3}\b", line_text, re.IGNORECASE) is not None
+        SECTION_REF_PREFIX_RE.match(line_text) is not None
+        or APPENDIX_REF_PREFIX_RE.match(line_text) is not None
     )
 
 
 def is_table_of_contents_header(text: str) -> bool:
-    collapsed = re.sub(r"\s+", "", text).upper()
+    collapsed = WHITESPACE_RE.sub("", text).upper()
     return "TABLEOFCONTENTS" in collapsed
 
 
 def is_appendix_reference_line(text: str) -> bool:
-    return re.search(r"^\s*APPENDIX\s+[A-Z]{1,3}\b", text, re.IGNORECASE) is not None
+    return APPENDIX_REF_PREFIX_RE.match(text) is not None
 
 
 def is_appendix_toc_line(text: str) -> bool:
     if not is_appendix_reference_line(text):
         return False
     stripped = text.strip()
-    if has_dot_leaders(stripped) or ends_with_page_reference(stripped):
+    if has_dot_leaders(stripped):
+        return True
+    # A page reference must end in a digit; skip the regexes otherwise.
+    if stripped[-1:].isdecimal() and ends_with_page_reference(stripped):
         return True
     if stripped == stripped.upper() and not has_prose_punctuation(stripped):
         return True
@@ -261,14 +356,7 @@ def is_appendix_toc_line(text: str) -> bool:
 
 
 def is_reference_header_line(text: str) -> bool:
-    return (
-        re.search(
-            r"^\s*(SECTION|APPENDIX|TABLE|FIGURE|CHAPTER|PART)\s+\1\s*$",
-            text,
-            re.IGNORECASE,
-        )
-        is not None
-    )
+    return REFERENCE_HEADER_RE.match(text) is not None
 
 
 def is_spanning_note_line(line: Dict, body_median_size: Optional[float], page_width: float) -> bool:
@@ -277,51 +365,46 @@ def is_spanning_note_line(line: Dict, body_median_size: Optional[float], page_wi
     size = line.get("size_median")
     if size is None:
         return False
-    if (line["x1"] - line["x0"]) < (page_width * 0.7):
+    if line["_width"] < (page_width * 0.7):
         return False
     return size <= (body_median_size - HEADER_SIZE_DELTA)
 
 
-def is_spanning_heading_line(line: Dict, page_width: float) -> bool:
+def is_spanning_heading_line(line: Dict, page_center: float, center_half: float) -> bool:
     text = line["text"]
-    if re.search(r"[a-z]", text):
+    if LOWERCASE_RE.search(text):
         return False
-    letters = re.findall(r"[A-Z]", text.upper())
+    letters = UPPERCASE_RE.findall(line["_upper"])
     if len(letters) < 4:
         return False
-    center = (line["x0"] + line["x1"]) / 2.0
-    return abs(center - (page_width / 2.0)) <= (page_width * (CENTER_BAND_RATIO / 2.0))
+    return abs(line["_center"] - page_center) <= center_half
 
 
-def is_index_letter_line(line: Dict, page_width: float) -> bool:
-    text = line["text"].strip()
+def is_index_letter_line(line: Dict, page_center: float, center_half: float) -> bool:
+    text = line["_stripped"]
     if len(text) != 1:
         return False
     if not text.isalpha():
         return False
-    center = (line["x0"] + line["x1"]) / 2.0
-    return abs(center - (page_width / 2.0)) <= (page_width * (CENTER_BAND_RATIO / 2.0))
+    return abs(line["_center"] - page_center) <= center_half
 
 
-def is_index_digit_line(line: Dict, page_width: float) -> bool:
-    text = line["text"].strip()
+def is_index_digit_line(line: Dict, page_center: float, center_half: float) -> bool:
+    text = line["_stripped"]
     if len(text) != 1 or not text.isdigit():
         return False
-    center = (line["x0"] + line["x1"]) / 2.0
-    return abs(center - (page_width / 2.0)) <= (page_width * (CENTER_BAND_RATIO / 2.0))
+    return abs(line["_center"] - page_center) <= center_half
 
 
-def is_spanning_symbol_line(line: Dict, page_width: float) -> bool:
-    text = line["text"].strip()
-    if re.match(r"^\(cid:\d+\)$", text):
-        center = (line["x0"] + line["x1"]) / 2.0
-        return abs(center - (page_width / 2.0)) <= (page_width * (CENTER_BAND_RATIO / 2.0))
+def is_spanning_symbol_line(line: Dict, page_center: float, center_half: float) -> bool:
+    text = line["_stripped"]
+    if text.startswith("(cid:") and CID_RE.match(text):
+        return abs(line["_center"] - page_center) <= center_half
     if len(text) != 1:
         return False
     if text.isalnum() or text.isspace():
         return False
-    center = (line["x0"] + line["x1"]) / 2.0
-    return abs(center - (page_width / 2.0)) <= (page_width * (CENTER_BAND_RATIO / 2.0))
+    return abs(line["_center"] - page_center) <= center_half
 
 
 def is_center_spanning_token(
@@ -334,17 +417,16 @@ def is_center_spanning_token(
     table_bboxes: List[Tuple[float, float, float, float]],
     eps: float = 2.0,
 ) -> bool:
-    text = (word.get("text") or "").strip()
-    if not re.match(r"^[A-Z]$", text):
-        return False
     x0 = word["x0"]
     x1 = word["x1"]
     if not (x0 < split_x < x1):
         return False
     if not (x0 >= (gutter_left - eps) and x1 <= (gutter_right + eps)):
         return False
-    word_height = word.get("bottom", word.get("top", 0.0)) - word.get("top", 0.0)
-    if word_height < (0.9 * page_median_word_height):
+    text = (word.get("text") or "").strip()
+    if not SINGLE_UPPER_RE.match(text):
+        return False
+    if word["_height"] < (0.9 * page_median_word_height):
         return False
     if inside_any_table(word, table_bboxes):
         return False
@@ -352,64 +434,157 @@ def is_center_spanning_token(
 
 
 def is_gutter_fragment_line(line: Dict, median_char_width: float) -> bool:
-    text = line["text"].strip()
+    text = line["_stripped"]
     if len(text) > 3:
         return False
-    if not re.match(r"^-?[A-Za-z]{1,2}$", text):
+    width = line["_width"]
+    if width > (median_char_width * 3.0):
         return False
-    width = line["x1"] - line["x0"]
-    return width <= (median_char_width * 3.0)
+    return GUTTER_ALPHA_RE.match(text) is not None
 
 
 def is_gutter_punct_fragment_line(line: Dict, median_char_width: float) -> bool:
-    text = line["text"].strip()
+    text = line["_stripped"]
     if len(text) > 2:
         return False
-    if re.search(r"[A-Za-z0-9]", text):
+    width = line["_width"]
+    if width > (median_char_width * 3.0):
         return False
-    width = line["x1"] - line["x0"]
-    return width <= (median_char_width * 3.0)
+    return ALNUM_RE.search(text) is None
 
 
 def is_gutter_numeric_fragment_line(line: Dict, median_char_width: float) -> bool:
-    text = line["text"].strip()
+    text = line["_stripped"]
     if len(text) > 3:
         return False
-    if not re.search(r"\d", text):
+    width = line["_width"]
+    if width > (median_char_width * 3.0):
         return False
-    if re.search(r"[A-Za-z]", text):
+    if not DIGIT_RE.search(text):
         return False
-    if not re.match(r"^[0-9().]+$", text):
+    if ALPHA_RE.search(text):
         return False
-    width = line["x1"] - line["x0"]
-    return width <= (median_char_width * 3.0)
+    return NUMERIC_FRAGMENT_RE.match(text) is not None
 
 
 def is_gutter_tiny_line(
     line: Dict, median_char_width: float, gutter_left: float, gutter_right: float
 ) -> bool:
-    text = line["text"].strip()
+    text = line["_stripped"]
     if len(text) > 3:
         return False
     if not text:
         return False
-    width = line["x1"] - line["x0"]
+    width = line["_width"]
     if width > (median_char_width * 3.0):
         return False
     return line["x0"] >= gutter_left and line["x1"] <= gutter_right
 
 
+def gutter_line_features(
+    line: Dict,
+    body_median_size: Optional[float],
+    page_width: float,
+    page_center: float,
+    center_half: float,
+    median_char_width: float,
+    gutter_left: float,
+    gutter_right: float,
+) -> Dict[str, bool]:
+    text = line["text"]
+    note_like = is_spanning_note_line(line, body_median_size, page_width)
+    symbol_like = is_spanning_symbol_line(line, page_center, center_half)
+    punct_fragment_like = is_gutter_punct_fragment_line(line, median_char_width)
+    numeric_fragment_like = is_gutter_numeric_fragment_line(line, median_char_width)
+    tiny_like = is_gutter_tiny_line(line, median_char_width, gutter_left, gutter_right)
+    prose_like = has_prose_punctuation(text) and not (
+        note_like or symbol_like or punct_fragment_like or numeric_fragment_like or tiny_like
+    )
+    return {
+        "dot_leaders": has_dot_leaders(text),
+        "toc_like": is_toc_reference_line(text),
+        "appendix_like": is_appendix_reference_line(text),
+        "reference_header_like": is_reference_header_line(text),
+        "note_like": note_like,
+        "index_letter_like": is_index_letter_line(line, page_center, center_half),
+        "index_digit_like": is_index_digit_line(line, page_center, center_half),
+        "symbol_like": symbol_like,
+        "fragment_like": is_gutter_fragment_line(line, median_char_width),
+        "punct_fragment_like": punct_fragment_like,
+        "numeric_fragment_like": numeric_fragment_like,
+        "tiny_like": tiny_like,
+        "section_header_match": match_section_header(line["_stripped"]) is not None,
+        "prose_like": prose_like,
+    }
+
+
+def is_gutter_reference_line(
+    line: Dict,
+    body_median_size: Optional[float],
+    page_width: float,
+    page_center: float,
+    center_half: float,
+    median_char_width: float,
+    gutter_left: float,
+    gutter_right: float,
+) -> bool:
+    # Same decision as gutter_line_features, ordered so short gutter tokens exit early.
+    text = line["text"]
+    if (
+        is_gutter_tiny_line(line, median_char_width, gutter_left, gutter_right)
+        or is_gutter_punct_fragment_line(line, median_char_width)
+        or is_gutter_numeric_fragment_line(line, median_char_width)
+        or is_spanning_symbol_line(line, page_center, center_half)
+        or is_spanning_note_line(line, body_median_size, page_width)
+    ):
+        # These shapes also clear prose_like.
+        reference_like = True
+    elif has_prose_punctuation(text):
+        return False
+    else:
+        reference_like = (
+            is_gutter_fragment_line(line, median_char_width)
+            or is_index_letter_line(line, page_center, center_half)
+            or is_index_digit_line(line, page_center, center_half)
+            or has_dot_leaders(text)
+            or is_appendix_reference_line(text)
+            or is_reference_header_line(text)
+        )
+    return reference_like and match_section_header(line["_stripped"]) is None
+
+
 def line_intersects_table(
     line: Dict, table_bboxes: List[Tuple[float, float, float, float]]
 ) -> bool:
+    if not table_bboxes:
+        return False
     x0 = line["x0"]
     x1 = line["x1"]
     y0 = line["top"]
-    y1 = line.get("bottom", line["top"])
+    y1 = line.get("bottom", y0)
+    # Callers pass table_bboxes sorted by top, so later tables start below this line too.
     for bx0, by0, bx1, by1 in table_bboxes:
-        if x1 < bx0 or x0 > bx1 or y1 < by0 or y0 > by1:
-            continue
-        return True
+        if by0 > y1:
+            break
+        if x1 >= bx0 and x0 <= bx1 and y0 <= by1:
+            return True
+    return False
+
+
+def bucket_tops(tops, tol: float) -> Dict[int, List[float]]:
+    buckets: Dict[int, List[float]] = {}
+    for top in tops:
+        buckets.setdefault(math.floor(top / tol), []).append(top)
+    return buckets
+
+
+def near_bucketed_top(top: float, buckets: Dict[int, List[float]], tol: float) -> bool:
+    # Any top within tol falls in this bucket or an adjacent one.
+    key = math.floor(top / tol)
+    for k in (key - 1, key, key + 1):
+        for t in buckets.get(k, ()):
+            if abs(top - t) <= tol:
+                return True
     return False
 
 
@@ -424,12 +599,13 @@ def select_top_spanning_lines(
                 "No body lines available to identify spanning headings.",
             )
         )
-    lines_sorted = sorted(lines, key=lambda l: (l["top"], l["x0"]))
+    # words_to_lines emits lines in strictly increasing top order, so no re-sort is needed.
+    page_center, center_half = center_band(page_width)
     top_lines: List[Dict] = []
     last_top: Optional[float] = None
     first_non_center_top: Optional[float] = None
-    for line in lines_sorted:
-        centered = is_centered_line(line, page_width)
+    for line in lines:
+        centered = is_centered_line(line, page_center, center_half)
         if not top_lines:
             if centered:
                 top_lines.append(line)
@@ -477,47 +653,54 @@ def detect_column_split(
         )
     ]
     words_for_gap = filtered_words if len(filtered_words) >= 2 else words
-    words_sorted = sorted(words_for_gap, key=lambda w: w["x0"])
-    max_x1 = words_sorted[0]["x1"]
+    words_sorted = sorted(words_for_gap, key=itemgetter("x0"))
+    # Gap before each word is its x0 minus the running max x1 of the words to its left.
+    running_max_x1 = accumulate((w["x1"] for w in words_sorted), max)
+    gaps: List[Tuple[float, float, float]] = [
+        (w["x0"] - max_x1, max_x1, w["x0"])
+        for w, max_x1 in zip(words_sorted[1:], running_max_x1)
+    ]
     best_gap = 0.0
     best_left = None
     best_right = None
-    gaps: List[Tuple[float, float, float]] = []
-    for w in words_sorted[1:]:
-        gap = w["x0"] - max_x1
-        gaps.append((gap, max_x1, w["x0"]))
-        if gap > best_gap:
-            best_gap = gap
-            best_left = max_x1
-            best_right = w["x0"]
-        max_x1 = max(max_x1, w["x1"])
+    if gaps:
+        widest = max(gaps, key=itemgetter(0))
+        if widest[0] > best_gap:
+            best_gap, best_left, best_right = widest
+    # Column-wise coordinates, extracted once for the cluster reductions below.
+    word_x0s = [w["x0"] for w in words]
+    word_x1s = [w["x1"] for w in words]
     center_x = page_width / 2.0
-    left_cluster = [w for w in words if w["x0"] < center_x]
-    right_cluster = [w for w in words if w["x0"] > center_x]
+    left_cluster_max_x1 = max(
+        (x1 for x0, x1 in zip(word_x0s, word_x1s) if x0 < center_x), default=None
+    )
+    right_cluster_min_x0 = min((x0 for x0 in word_x0s if x0 > center_x), default=None)
+    has_left_cluster = left_cluster_max_x1 is not None
+    has_right_cluster = right_cluster_min_x0 is not None
     single_side: Optional[str] = None
-    if left_cluster and not right_cluster:
-        best_left = max(w["x1"] for w in left_cluster)
+    if has_left_cluster and not has_right_cluster:
+        best_left = left_cluster_max_x1
         best_right = center_x
         best_gap = best_right - best_left
         single_side = "left"
-    elif right_cluster and not left_cluster:
+    elif has_right_cluster and not has_left_cluster:
         best_left = center_x
-        best_right = min(w["x0"] for w in right_cluster)
+        best_right = right_cluster_min_x0
         best_gap = best_right - best_left
         single_side = "right"
     if best_left is None or best_right is None or best_gap <= 0.0:
-        if left_cluster and right_cluster:
-            best_left = max(w["x1"] for w in left_cluster)
-            best_right = min(w["x0"] for w in right_cluster)
+        if has_left_cluster and has_right_cluster:
+            best_left = left_cluster_max_x1
+            best_right = right_cluster_min_x0
             best_gap = best_right - best_left
-        elif left_cluster and not right_cluster:
-            best_left = max(w["x1"] for w in left_cluster)
+        elif has_left_cluster and not has_right_cluster:
+            best_left = left_cluster_max_x1
             best_right = center_x
             best_gap = best_right - best_left
             single_side = "left"
-        elif right_cluster and not left_cluster:
+        elif has_right_cluster and not has_left_cluster:
             best_left = center_x
-            best_right = min(w["x0"] for w in right_cluster)
+            best_right = right_cluster_min_x0
             best_gap = best_right - best_left
             single_side = "right"
         if best_left is None or best_right is None or best_gap <= 0.0:
@@ -546,23 +729,20 @@ def detect_column_split(
     if single_side is None and abs(split_x - (page_width / 2.0)) > (
         page_width * SPLIT_CENTER_TOLERANCE_RATIO
     ):
-        center_x = page_width / 2.0
-        left_cluster = [w for w in words if w["x0"] < center_x]
-        right_cluster = [w for w in words if w["x0"] > center_x]
-        if left_cluster and right_cluster:
-            alt_left = max(w["x1"] for w in left_cluster)
-            alt_right = min(w["x0"] for w in right_cluster)
+        if has_left_cluster and has_right_cluster:
+            alt_left = left_cluster_max_x1
+            alt_right = right_cluster_min_x0
             if alt_left < alt_right:
                 split_x = (alt_left + alt_right) / 2.0
                 best_left = alt_left
                 best_right = alt_right
             else:
                 split_x = center_x
-                left_words = [w for w in words if w["x1"] <= split_x]
-                right_words = [w for w in words if w["x0"] >= split_x]
-                if left_words and right_words:
-                    left_max_x1 = max(w["x1"] for w in left_words)
-                    right_min_x0 = min(w["x0"] for w in right_words)
+                left_x1s = [x1 for x1 in word_x1s if x1 <= split_x]
+                right_x0s = [x0 for x0 in word_x0s if x0 >= split_x]
+                if left_x1s and right_x0s:
+                    left_max_x1 = max(left_x1s)
+                    right_min_x0 = min(right_x0s)
                     if left_max_x1 < right_min_x0:
                         best_left = left_max_x1
                         best_right = right_min_x0
@@ -582,10 +762,10 @@ def detect_column_split(
                     f"Split {split_x:.2f} too far from center.",
                 )
             )
-    left_words = [w for w in words if w["x1"] < split_x]
-    right_words = [w for w in words if w["x0"] > split_x]
-    if not left_words or not right_words:
-        if not left_words and not right_words:
+    left_x1s = [x1 for x1 in word_x1s if x1 < split_x]
+    right_x0s = [x0 for x0 in word_x0s if x0 > split_x]
+    if not left_x1s or not right_x0s:
+        if not left_x1s and not right_x0s:
             raise RuntimeError(
                 format_error(
                     "COLUMN_SPLIT_CLUSTER_MISSING",
@@ -593,8 +773,8 @@ def detect_column_split(
                     "Column split does not yield two word clusters.",
                 )
             )
-        if not right_words:
-            left_max = max(w["x1"] for w in words)
+        if not right_x0s:
+            left_max = max(word_x1s)
             if left_max > (split_x + GUTTER_TOLERANCE):
                 raise RuntimeError(
                     format_error(
@@ -603,8 +783,8 @@ def detect_column_split(
                         "Column split does not yield two word clusters.",
                     )
                 )
-        if not left_words:
-            right_min = min(w["x0"] for w in words)
+        if not left_x1s:
+            right_min = min(word_x0s)
             if right_min < (split_x - GUTTER_TOLERANCE):
                 raise RuntimeError(
                     format_error(
@@ -613,9 +793,9 @@ def detect_column_split(
                         "Column split does not yield two word clusters.",
                     )
                 )
-    if left_words and right_words:
-        left_max_x1 = max(w["x1"] for w in left_words)
-        right_min_x0 = min(w["x0"] for w in right_words)
+    if left_x1s and right_x0s:
+        left_max_x1 = max(left_x1s)
+        right_min_x0 = min(right_x0s)
         if not (left_max_x1 < split_x and right_min_x0 > split_x):
             raise RuntimeError(
                 format_error(
@@ -625,22 +805,18 @@ def detect_column_split(
                     stats={"left_max_x1": left_max_x1, "right_min_x0": right_min_x0},
                 )
             )
-    heights = [
-        w.get("bottom", w.get("top", 0.0)) - w.get("top", 0.0)
-        for w in words
-        if w.get("bottom") is not None and w.get("top") is not None
-    ]
+    heights = word_heights(words)
     page_median_word_height = median(heights) if heights else 0.0
     if page_median_word_height > 0.0:
         center_token_candidates = []
         for w in words:
-            text = (w.get("text") or "").strip()
-            if not re.match(r"^[A-Z]$", text):
-                continue
+            # Few words straddle the split; test that before touching the text.
             if not (w["x0"] < split_x < w["x1"]):
                 continue
-            word_height = w.get("bottom", w.get("top", 0.0)) - w.get("top", 0.0)
-            if word_height < (0.9 * page_median_word_height):
+            text = (w.get("text") or "").strip()
+            if not SINGLE_UPPER_RE.match(text):
+                continue
+            if w["_height"] < (0.9 * page_median_word_height):
                 continue
             if inside_any_table(w, table_bboxes):
                 continue
@@ -709,8 +885,10 @@ def build_ordered_lines(
     if not chars:
         return [], {}
 
+    table_bboxes = sorted(table_bboxes, key=itemgetter(1))
     header_limit = page_height * HEADER_REGION_RATIO
     footer_limit = page_height * (1.0 - FOOTER_REGION_RATIO)
+    page_center, center_half = center_band(page_width)
 
     body_chars = [c for c in chars if header_limit < c["top"] < footer_limit]
     if not body_chars:
@@ -728,69 +906,67 @@ def build_ordered_lines(
         lines, page_width, page_num
     )
     top_line_tops = {line["top"] for line in top_lines}
-    centered_structural_lines = [
-        line
-        for line in lines
-        if is_centered_line(line, page_width)
-        and not SECTION_HEADER_RE.match(line["text"].strip())
-        and not TABLE_LABEL_RE.match(line["text"].strip())
-    ]
-    centered_structural_tops = {line["top"] for line in centered_structural_lines}
-    spanning_note_lines = [
-        line
-        for line in lines
-        if is_spanning_note_line(line, body_median_size, page_width)
-        and not SECTION_HEADER_RE.match(line["text"].strip())
-        and not TABLE_LABEL_RE.match(line["text"].strip())
-    ]
-    spanning_note_tops = {line["top"] for line in spanning_note_lines}
-    spanning_heading_lines = [
-        line
-        for line in lines
-        if is_spanning_heading_line(line, page_width)
-        and not SECTION_HEADER_RE.match(line["text"].strip())
-        and not TABLE_LABEL_RE.match(line["text"].strip())
-    ]
-    spanning_heading_tops = {line["top"] for line in spanning_heading_lines}
+    centered_structural_lines: List[Dict] = []
+    centered_structural_tops = set()
+    spanning_note_lines: List[Dict] = []
+    spanning_note_tops = set()
+    spanning_heading_lines: List[Dict] = []
+    spanning_heading_tops = set()
+    for line in lines:
+        stripped = line["_stripped"]
+        if match_section_header(stripped) or TABLE_LABEL_RE.match(stripped):
+            continue
+        if is_centered_line(line, page_center, center_half):
+            centered_structural_lines.append(line)
+            centered_structural_tops.add(line["top"])
+        if is_spanning_note_line(line, body_median_size, page_width):
+            spanning_note_lines.append(line)
+            spanning_note_tops.add(line["top"])
+        if is_spanning_heading_line(line, page_center, center_half):
+            spanning_heading_lines.append(line)
+            spanning_heading_tops.add(line["top"])
+    # The classified lists hold the same dicts as lines, so membership is by identity.
+    top_line_ids = {id(line) for line in top_lines}
+    centered_structural_ids = {id(line) for line in centered_structural_lines}
+    spanning_note_ids = {id(line) for line in spanning_note_lines}
+    spanning_heading_ids = {id(line) for line in spanning_heading_lines}
 
     body_words = [w for w in words if header_limit < w["top"] < footer_limit]
+    cache_word_heights(body_words)
+    excluded_top_buckets = bucket_tops(
+        top_line_tops | centered_structural_tops | spanning_note_tops | spanning_heading_tops,
+        LINE_Y_TOLERANCE,
+    )
     words_for_split = [
         w
         for w in body_words
-        if not any(abs(w["top"] - t) <= LINE_Y_TOLERANCE for t in top_line_tops)
-        and not any(abs(w["top"] - t) <= LINE_Y_TOLERANCE for t in centered_structural_tops)
-        and not any(abs(w["top"] - t) <= LINE_Y_TOLERANCE for t in spanning_note_tops)
-        and not any(abs(w["top"] - t) <= LINE_Y_TOLERANCE for t in spanning_heading_tops)
-    ]
-    split_word_heights = [
-        w.get("bottom", w.get("top", 0.0)) - w.get("top", 0.0)
-        for w in words_for_split
-        if w.get("bottom") is not None and w.get("top") is not None
+        if not near_bucketed_top(w["top"], excluded_top_buckets, LINE_Y_TOLERANCE)
     ]
+    split_word_heights = word_heights(words_for_split)
     page_median_word_height = median(split_word_heights) if split_word_heights else 0.0
     if not words_for_split:
         spanning_lines: List[Dict] = []
         for line in lines:
-            if line in top_lines:
+            if id(line) in top_line_ids:
                 line["column"] = "spanning"
                 line["role"] = "spanning_header"
                 spanning_lines.append(line)
                 continue
-            if line in centered_structural_lines:
+            if id(line) in centered_structural_ids:
                 line["column"] = "center_structural"
                 line["role"] = "center_structural"
                 continue
-            if line in spanning_note_lines and not line_intersects_table(line, table_bboxes):
+            if id(line) in spanning_note_ids and not line_intersects_table(line, table_bboxes):
                 line["column"] = "spanning"
                 line["role"] = "spanning_reference"
                 spanning_lines.append(line)
                 continue
-            if line in spanning_heading_lines and not line_intersects_table(line, table_bboxes):
+            if id(line) in spanning_heading_ids and not line_intersects_table(line, table_bboxes):
                 line["column"] = "spanning"
                 line["role"] = "spanning_reference"
                 spanning_lines.append(line)
                 continue
-        ordered_lines = sorted(spanning_lines, key=lambda l: (l["top"], l["x0"]))
+        ordered_lines = sorted(spanning_lines, key=itemgetter("top", "x0"))
         bounds_source = body_words or body_chars
         x0_values = [w["x0"] for w in bounds_source if w.get("x0") is not None]
         x1_values = [w["x1"] for w in bounds_source if w.get("x1") is not None]
@@ -833,119 +1009,99 @@ def build_ordered_lines(
     right_lines: List[Dict] = []
     spanning_lines: List[Dict] = []
     for line in lines:
-        if line in top_lines:
+        if id(line) in top_line_ids:
             line["column"] = "spanning"
             line["role"] = "spanning_header"
             spanning_lines.append(line)
             continue
-        if line in centered_structural_lines:
+        if id(line) in centered_structural_ids:
             line["column"] = "center_structural"
             line["role"] = "center_structural"
             continue
-        if line in spanning_note_lines and not line_intersects_table(line, table_bboxes):
+        if id(line) in spanning_note_ids and not line_intersects_table(line, table_bboxes):
             line["column"] = "spanning"
             line["role"] = "spanning_reference"
             spanning_lines.append(line)
             continue
-        if line in spanning_heading_lines and not line_intersects_table(line, table_bboxes):
+        if id(line) in spanning_heading_ids and not line_intersects_table(line, table_bboxes):
             line["column"] = "spanning"
             line["role"] = "spanning_reference"
             spanning_lines.append(line)
             continue
 
-    excluded_line_tops = {
-        line["top"] for line in spanning_lines
-    } | {line["top"] for line in centered_structural_lines}
-    body_words_filtered = [
-        w
-        for w in body_words
-        if not any(abs(w["top"] - t) <= LINE_Y_TOLERANCE for t in excluded_line_tops)
-    ]
+    excluded_line_buckets = bucket_tops(
+        {line["top"] for line in spanning_lines}
+        | {line["top"] for line in centered_structural_lines},
+        LINE_Y_TOLERANCE,
+    )
+    body_words_filtered = body_words
+    if excluded_line_buckets:
+        body_words_filtered = [
+            w
+            for w in body_words
+            if not near_bucketed_top(w["top"], excluded_line_buckets, LINE_Y_TOLERANCE)
+        ]
     left_words: List[Dict] = []
     right_words: List[Dict] = []
     gutter_words: List[Dict] = []
+    left_limit = split_x - (GUTTER_TOLERANCE / 2.0)
+    right_limit = split_x + (GUTTER_TOLERANCE / 2.0)
     for w in body_words_filtered:
-        if w["x0"] < split_x < w["x1"]:
-            if is_center_spanning_token(
-                w,
-                split_x,
-                gutter_left,
-                gutter_right,
-                page_width,
-                page_median_word_height,
-                table_bboxes,
-            ):
-                gutter_words.append(w)
-                continue
-        center = (w["x0"] + w["x1"]) / 2.0
-        if center < (split_x - (GUTTER_TOLERANCE / 2.0)):
-            left_words.append(w)
+        x0 = w["x0"]
+        x1 = w["x1"]
+        # Only words straddling the split can be center-spanning tokens.
+        if x0 < split_x < x1 and is_center_spanning_token(
+            w,
+            split_x,
+            gutter_left,
+            gutter_right,
+            page_width,
+            page_median_word_height,
+            table_bboxes,
+        ):
+            gutter_words.append(w)
             continue
-        if center > (split_x + (GUTTER_TOLERANCE / 2.0)):
+        center = (x0 + x1) / 2.0
+        if center < left_limit:
+            left_words.append(w)
+        elif center > right_limit:
             right_words.append(w)
-            continue
-        gutter_words.append(w)
+        else:
+            gutter_words.append(w)
 
     if gutter_words:
         gutter_lines = words_to_lines(
             gutter_words, LINE_Y_TOLERANCE, page_gap_threshold, page_median_width
         )
         for line in gutter_lines:
-            dot_leaders = has_dot_leaders(line["text"])
-            toc_like = is_toc_reference_line(line["text"])
-            appendix_like = is_appendix_reference_line(line["text"])
-            reference_header_like = is_reference_header_line(line["text"])
-            note_like = is_spanning_note_line(line, body_median_size, page_width)
-            index_letter_like = is_index_letter_line(line, page_width)
-            index_digit_like = is_index_digit_line(line, page_width)
-            symbol_like = is_spanning_symbol_line(line, page_width)
-            fragment_like = is_gutter_fragment_line(line, page_median_width)
-            punct_fragment_like = is_gutter_punct_fragment_line(line, page_median_width)
-            numeric_fragment_like = is_gutter_numeric_fragment_line(
-                line, page_median_width
-            )
-            tiny_like = is_gutter_tiny_line(line, page_median_width, gutter_left, gutter_right)
-            section_header_match = SECTION_HEADER_RE.match(line["text"].strip()) is not None
-            prose_like = has_prose_punctuation(line["text"])
-            if note_like:
-                prose_like = False
-            if symbol_like:
-                prose_like = False
-            if punct_fragment_like:
-                prose_like = False
-            if numeric_fragment_like:
-                prose_like = False
-            if tiny_like:
-                prose_like = False
             intersects_table = line_intersects_table(line, table_bboxes)
-            if re.match(r"^[A-Z]$", line["text"].strip()) and not intersects_table:
-                line["column"] = "spanning"
-                line["role"] = "spanning_reference"
-                spanning_lines.append(line)
-                continue
-            if (
-                not prose_like
-                and (
-                    dot_leaders
-                    or toc_like
-                    or appendix_like
-                    or reference_header_like
-                    or note_like
-                    or index_letter_like
-                    or index_digit_like
-                    or symbol_like
-                    or fragment_like
-                    or punct_fragment_like
-                    or numeric_fragment_like
-                    or tiny_like
+            if not intersects_table and (
+                SINGLE_UPPER_RE.match(line["_stripped"])
+                or is_gutter_reference_line(
+                    line,
+                    body_median_size,
+                    page_width,
+                    page_center,
+                    center_half,
+                    page_median_width,
+                    gutter_left,
+                    gutter_right,
                 )
-                and not intersects_table
-                and not section_header_match
             ):
                 line["column"] = "spanning"
                 line["role"] = "spanning_reference"
                 spanning_lines.append(line)
                 continue
+            features = gutter_line_features(
+                line,
+                body_median_size,
+                page_width,
+                page_center,
+                center_half,
+                page_median_width,
+                gutter_left,
+                gutter_right,
+            )
             raise RuntimeError(
                 format_error(
                     "GUTTER_LINE_AMBIGUOUS",
@@ -954,20 +1110,7 @@ def build_ordered_lines(
                     stats={
                         "text": line["text"],
                         "bbox": [line["x0"], line["top"], line["x1"], line.get("bottom", line["top"])],
-                        "dot_leaders": dot_leaders,
-                        "toc_like": toc_like,
-                        "appendix_like": appendix_like,
-                        "reference_header_like": reference_header_like,
-                        "note_like": note_like,
-                        "index_letter_like": index_letter_like,
-                        "index_digit_like": index_digit_like,
-                        "symbol_like": symbol_like,
-                        "fragment_like": fragment_like,
-                        "punct_fragment_like": punct_fragment_like,
-                        "numeric_fragment_like": numeric_fragment_like,
-                        "tiny_like": tiny_like,
-                        "section_header_match": section_header_match,
-                        "prose_like": prose_like,
+                        **features,
                         "intersects_table": intersects_table,
                     },
                 )
@@ -989,29 +1132,26 @@ def build_ordered_lines(
     for line in right_lines:
         line["column"] = "right"
 
-    ordered_lines = (
-        sorted(spanning_lines, key=lambda l: (l["top"], l["x0"]))
-        + sorted(left_lines, key=lambda l: (l["top"], l["x0"]))
-        + sorted(right_lines, key=lambda l: (l["top"], l["x0"]))
-    )
+    # Column lines come from words_to_lines already in top order; only the
+    # spanning lines, gathered from several passes, need sorting.
+    ordered_lines = sorted(spanning_lines, key=itemgetter("top", "x0"))
+    ordered_lines.extend(left_lines)
+    ordered_lines.extend(right_lines)
 
+    left_x0_values = [w["x0"] for w in left_words]
+    right_x0_values = [w["x0"] for w in right_words]
+    left_x0_p5 = percentile(left_x0_values, 5.0, page_num, "left_x0") if left_x0_values else 0.0
     column_bounds = {
         "split_x": split_x,
         "gutter_left": gutter_left,
         "gutter_right": gutter_right,
-        "left_x0_min": min((w["x0"] for w in left_words), default=0.0),
-        "right_x0_min": min((w["x0"] for w in right_words), default=0.0),
-        "left_x0_p5": percentile([w["x0"] for w in left_words], 5.0, page_num, "left_x0_p5")
-        if left_words
-        else 0.0,
-        "right_x0_p5": percentile(
-            [w["x0"] for w in right_words], 5.0, page_num, "right_x0_p5"
-        )
-        if right_words
-        else 0.0,
-        "left_x0": percentile([w["x0"] for w in left_words], 5.0, page_num, "left_x0")
-        if left_words
+        "left_x0_min": min(left_x0_values, default=0.0),
+        "right_x0_min": min(right_x0_values, default=0.0),
+        "left_x0_p5": left_x0_p5,
+        "right_x0_p5": percentile(right_x0_values, 5.0, page_num, "right_x0_p5")
+        if right_x0_values
         else 0.0,
+        "left_x0": left_x0_p5,
         "margin_percentile": 5.0,
         "spacing_thresholds": {
             "page_median_char_width": page_median_width,
@@ -1073,210 +1213,16 @@ def passes_header_position_style(
     )
 
 
-# CANONICAL: section boundary detection (regex + header position/style checks).
-def detect_section_start(
-    line: Dict,
-    next_line: Optional[Dict],
-    next_next_line: Optional[Dict],
-    column_bounds: Dict[str, float],
-    page_num: int,
-    body_median_size: float,
-    debug: Optional[List[Dict]] = None,
-) -> Optional[str]:
-    if is_toc_reference_line(line["text"]) or is_appendix_toc_line(line["text"]):
-        if debug is not None:
-            debug.append(
-                {
-                    "text": line["text"],
-                    "decision": "reject",
-                    "reason": "toc_reference_line",
-                    "page": page_num,
-                }
-            )
-        return None
-    if next_line and is_toc_reference_continuation(line["text"], next_line["text"]):
-        if debug is not None:
-            debug.append(
-                {
-                    "text": line["text"],
-                    "decision": "reject",
-                    "reason": "toc_reference_continuation",
-                    "page": page_num,
-                }
-            )
-        return None
-    match = SECTION_TEXT_RE.match(line["text"])
-    if not match:
-        section_only_match = re.match(
-            r"^\s*SECTION\s+([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$",
-            line["text"],
-            re.IGNORECASE,
-        )
-        if section_only_match:
-            if next_line:
-                title_line = next_line["text"]
-                if (
-                    title_starts_with_upper_or_digit(title_line)
-                    and title_has_non_id_text(title_line)
-                    and not has_dot_leaders(title_line)
-                    and not has_prose_punctuation(title_line)
-                ):
-                    section_id = section_only_match.group(1)
-                    if not passes_header_position_style(
-                        line, column_bounds, body_median_size
-                    ):
-                        if debug is not None:
-                            debug.append(
-                                {
-                                    "text": line["text"],
-                                    "decision": "reject",
-                                    "reason": "header_position_style",
-                                    "page": page_num,
-                                }
-                            )
-                        return None
-                    if debug is not None:
-                        debug.append(
-                            {
-                                "text": line["text"],
-                                "decision": "accept",
-                                "section_id": section_id,
-                                "page": page_num,
-                            }
-                        )
-                    return section_id
-            else:
-                section_id = section_only_match.group(1)
-                if not passes_header_position_style(line, column_bounds, body_median_size):
-                    if debug is not None:
-                        debug.append(
-                            {
-                                "text": line["text"],
-                                "decision": "reject",
-                                "reason": "header_position_style",
-                                "page": page_num,
-                            }
-                        )
-                    return None
-                if debug is not None:
-                    debug.append(
-                        {
-                            "text": line["text"],
-                            "decision": "accept",
-                            "section_id": section_id,
-                            "page": page_num,
-                        }
-                    )
-                return section_id
-        bare_id_match = re.match(
-            r"^\s*([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$",
-            line["text"],
-            re.IGNORECASE,
-        )
-        if bare_id_match and next_line and not is_body_indented(line, column_bounds):
-            title_line = next_line["text"]
-            if (
-                not is_body_indented(next_line, column_bounds)
-                and title_has_space_or_lowercase(title_line)
-                and title_starts_with_upper_or_digit(title_line)
-                and title_has_non_id_text(title_line)
-                and not title_all_caps_no_space(title_line)
-                and not has_dot_leaders(title_line)
-                and not has_prose_punctuation(title_line)
-            ):
-                section_id = bare_id_match.group(1)
-                if not passes_header_position_style(line, column_bounds, body_median_size):
-                    if debug is not None:
-                        debug.append(
-                            {
-                                "text": line["text"],
-                                "decision": "reject",
-                                "reason": "header_position_style",
-                                "page": page_num,
-                            }
-                        )
-                    return None
-                if debug is not None:
-                    debug.append(
-                        {
-                            "text": line["text"],
-                            "decision": "accept",
-                            "section_id": section_id,
-                            "page": page_num,
-                        }
-                    )
-                return section_id
-        appendix_match = re.match(
-            r"^\s*APPENDIX\s+([A-Z]+)\b(?:\s+(.+))?$",
-            line["text"],
-            re.IGNORECASE,
-        )
-        appendix_title = appendix_match.group(2) if appendix_match else None
-        if (
-            appendix_match
-            and appendix_title
-            and not has_dot_leaders(line["text"])
-            and title_starts_with_upper_or_digit(appendix_title)
-            and title_has_non_id_text(appendix_title)
-        ):
-            section_id = f"Appendix {appendix_match.group(1)}"
-            if not passes_header_position_style(line, column_bounds, body_median_size):
-                if debug is not None:
-                    debug.append(
-                        {
-                            "text": line["text"],
-                            "decision": "reject",
-                            "reason": "header_position_style",
-                            "page": page_num,
-                        }
-                    )
-                return None
-            if debug is not None:
-                debug.append(
-                    {
-                        "text": line["text"],
-                        "decision": "accept",
-                        "section_id": section_id,
-                        "page": page_num,
-                    }
-                )
-            return section_id
-        header_match = SECTION_HEADER_RE.match(line["text"].strip())
-        if (
-            header_match
-            and header_match.group(2)
-            and not re.match(r"^\s*SECTION\b", line["text"], re.IGNORECASE)
-            and not has_dot_leaders(line["text"])
-            and title_starts_with_upper_or_digit(header_match.group(2))
-            and title_has_non_id_text(header_match.group(2))
-            and not (
-                title_all_caps_no_space(header_match.group(2))
-                and len(header_match.group(2).strip()) > 4
-            )
-        ):
-            section_id = header_match.group(1)
-            if not passes_header_position_style(line, column_bounds, body_median_size):
-                if debug is not None:
-                    debug.append(
-                        {
-                            "text": line["text"],
-                            "decision": "reject",
-                            "reason": "header_position_style",
-                            "page": page_num,
-                        }
-                    )
-                return None
-            if debug is not None:
-                debug.append(
-                    {
-                        "text": line["text"],
-                        "decision": "accept",
-                        "section_id": section_id,
-                        "page": page_num,
-                    }
-                )
-            return section_id
-        return None
+def is_section_title_line(title_line: str) -> bool:
+    return (
+        title_starts_with_upper_or_digit(title_line)
+        and title_has_non_id_text(title_line)
+        and not has_dot_leaders(title_line)
+        and not has_prose_punctuation(title_line)
+    )
+
+
+def section_id_from_text_match(match: re.Match, line_text: str) -> Optional[str]:
     section_token = match.group(2)
     appendix_token = match.group(3)
     id_token = match.group(4)
@@ -1286,27 +1232,9 @@ def detect_section_start(
         section_id = f"Appendix {appendix_token}"
     else:
         section_id = id_token
-    if section_token:
-        title_text = re.sub(
-            rf"^\s*SECTION\s+{re.escape(section_id)}\s+",
-            "",
-            line["text"],
-            flags=re.IGNORECASE,
-        )
-    elif appendix_token:
-        title_text = re.sub(
-            rf"^\s*APPENDIX\s+{re.escape(appendix_token)}\s+",
-            "",
-            line["text"],
-            flags=re.IGNORECASE,
-        )
-    else:
-        title_text = re.sub(
-            rf"^\s*{re.escape(section_id)}\s+",
-            "",
-            line["text"],
-            flags=re.IGNORECASE,
-        )
+    # The matched token is always followed by whitespace, so the title is the rest of the line.
+    token_group = 2 if section_token else 3 if appendix_token else 4
+    title_text = line_text[match.end(token_group):].lstrip()
     if not title_starts_with_upper_or_digit(title_text) or not title_has_non_id_text(
         title_text
     ):
@@ -1317,6 +1245,49 @@ def detect_section_start(
         and len(title_text.strip()) > 4
     ):
         return None
+    return section_id
+
+
+def appendix_heading_id(line_text: str) -> Optional[str]:
+    appendix_match = APPENDIX_HEADING_RE.match(line_text)
+    appendix_title = appendix_match.group(2) if appendix_match else None
+    if (
+        appendix_match
+        and appendix_title
+        and not has_dot_leaders(line_text)
+        and title_starts_with_upper_or_digit(appendix_title)
+        and title_has_non_id_text(appendix_title)
+    ):
+        return f"Appendix {appendix_match.group(1)}"
+    return None
+
+
+def section_header_heading_id(line_text: str) -> Optional[str]:
+    header_match = match_section_header(line_text.strip())
+    if (
+        header_match
+        and header_match.group(2)
+        and not SECTION_WORD_RE.match(line_text)
+        and not has_dot_leaders(line_text)
+        and title_starts_with_upper_or_digit(header_match.group(2))
+        and title_has_non_id_text(header_match.group(2))
+        and not (
+            title_all_caps_no_space(header_match.group(2))
+            and len(header_match.group(2).strip()) > 4
+        )
+    ):
+        return header_match.group(1)
+    return None
+
+
+def accept_section_start(
+    line: Dict,
+    section_id: str,
+    column_bounds: Dict[str, float],
+    page_num: int,
+    body_median_size: float,
+    debug: Optional[List[Dict]],
+) -> Optional[str]:
     if not passes_header_position_style(line, column_bounds, body_median_size):
         if debug is not None:
             debug.append(
@@ -1340,8 +1311,88 @@ def detect_section_start(
     return section_id
 
 
+# CANONICAL: section boundary detection (regex + header position/style checks).
+def detect_section_start(
+    line: Dict,
+    next_line: Optional[Dict],
+    next_next_line: Optional[Dict],
+    column_bounds: Dict[str, float],
+    page_num: int,
+    body_median_size: float,
+    debug: Optional[List[Dict]] = None,
+) -> Optional[str]:
+    if is_toc_reference_line(line["text"]) or is_appendix_toc_line(line["text"]):
+        if debug is not None:
+            debug.append(
+                {
+                    "text": line["text"],
+                    "decision": "reject",
+                    "reason": "toc_reference_line",
+                    "page": page_num,
+                }
+            )
+        return None
+    if next_line and is_toc_reference_continuation(line["text"], next_line["text"]):
+        if debug is not None:
+            debug.append(
+                {
+                    "text": line["text"],
+                    "decision": "reject",
+                    "reason": "toc_reference_continuation",
+                    "page": page_num,
+                }
+            )
+        return None
+    match = SECTION_TEXT_RE.match(line["text"])
+    if match:
+        section_id = section_id_from_text_match(match, line["text"])
+        if section_id is None:
+            return None
+        return accept_section_start(
+            line, section_id, column_bounds, page_num, body_median_size, debug
+        )
+    # Unlike detect_section_start_text, a rejected SECTION-only or bare-id
+    # line falls through to the remaining heading shapes.
+    section_only_match = SECTION_ONLY_RE.match(line["text"])
+    if section_only_match and (not next_line or is_section_title_line(next_line["text"])):
+        return accept_section_start(
+            line,
+            section_only_match.group(1),
+            column_bounds,
+            page_num,
+            body_median_size,
+            debug,
+        )
+    bare_id_match = BARE_SECTION_ID_RE.match(line["text"])
+    if bare_id_match and next_line and not is_body_indented(line, column_bounds):
+        title_line = next_line["text"]
+        if (
+            not is_body_indented(next_line, column_bounds)
+            and title_has_space_or_lowercase(title_line)
+            and title_starts_with_upper_or_digit(title_line)
+            and title_has_non_id_text(title_line)
+            and not title_all_caps_no_space(title_line)
+            and not has_dot_leaders(title_line)
+            and not has_prose_punctuation(title_line)
+        ):
+            return accept_section_start(
+                line,
+                bare_id_match.group(1),
+                column_bounds,
+                page_num,
+                body_median_size,
+                debug,
+            )
+    section_id = appendix_heading_id(line["text"]) or section_header_heading_id(line["text"])
+    if section_id is None:
+        return None
+    return accept_section_start(
+        line, section_id, column_bounds, page_num, body_median_size, debug
+    )
+
+
 def section_id_depth(section_id: str) -> int:
-    return len(re.findall(r"\d+", section_id))
+    return len(DIGIT_RUN_RE.findall(section_id))
 
 
 def title_starts_with_upper_or_digit(title: Optional[str]) -> bool:
@@ -1360,11 +1411,8 @@ def title_has_non_id_text(title: Optional[str]) -> bool:
     stripped = title.strip()
     if not stripped:
         return False
-    without_ids = re.sub(
-        r"[A-Z]{1,3}\d{3,4}(?:\.\d+)*", "", stripped, flags=re.IGNORECASE
-    )
-    without_ids = re.sub(r"[^A-Za-z0-9]+", "", without_ids)
-    return bool(without_ids)
+    without_ids = SECTION_ID_RE.sub("", stripped)
+    return ALNUM_RE.search(without_ids) is not None
 
 
 def title_all_caps_no_space(title: Optional[str]) -> bool:
@@ -1388,7 +1436,7 @@ def title_has_space_or_lowercase(title: Optional[str]) -> bool:
         return False
     if " " in stripped:
         return True
-    return any(ch.islower() for ch in stripped)
+    return any(map(str.islower, stripped))
 
 
 def title_starts_with_upper(title: Optional[str]) -> bool:
@@ -1409,70 +1457,13 @@ def detect_section_start_text(
         return None
     match = SECTION_TEXT_RE.match(line_text)
     if match:
-        section_token = match.group(2)
-        appendix_token = match.group(3)
-        id_token = match.group(4)
-        if section_token:
-            section_id = section_token
-        elif appendix_token:
-            section_id = f"Appendix {appendix_token}"
-        else:
-            section_id = id_token
-        if section_token:
-            title_text = re.sub(
-                rf"^\s*SECTION\s+{re.escape(section_id)}\s+",
-                "",
-                line_text,
-                flags=re.IGNORECASE,
-            )
-        elif appendix_token:
-            title_text = re.sub(
-                rf"^\s*APPENDIX\s+{re.escape(appendix_token)}\s+",
-                "",
-                line_text,
-                flags=re.IGNORECASE,
-            )
-        else:
-            title_text = re.sub(
-                rf"^\s*{re.escape(section_id)}\s+",
-                "",
-                line_text,
-                flags=re.IGNORECASE,
-            )
-        if not title_starts_with_upper_or_digit(title_text) or not title_has_non_id_text(
-            title_text
-        ):
-            return None
-        if (
-            not section_id.lower().startswith("appendix")
-            and title_all_caps_no_space(title_text)
-            and len(title_text.strip()) > 4
-        ):
-            return None
-        return section_id
-    section_only_match = re.match(
-        r"^\s*SECTION\s+([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$",
-        line_text,
-        re.IGNORECASE,
-    )
+        return section_id_from_text_match(match, line_text)
+    section_only_match = SECTION_ONLY_RE.match(line_text)
     if section_only_match:
-        section_id = section_only_match.group(1)
-        if next_line_text:
-            title_line = next_line_text
-            if (
-                title_starts_with_upper_or_digit(title_line)
-                and title_has_non_id_text(title_line)
-                and not has_dot_leaders(title_line)
-                and not has_prose_punctuation(title_line)
-            ):
-                return section_id
+        if next_line_text and not is_section_title_line(next_line_text):
             return None
-        return section_id
-    bare_id_match = re.match(
-        r"^\s*([A-Z]{1,3}\d{3,4}(?:\.\d+)*)\b\s*$",
-        line_text,
-        re.IGNORECASE,
-    )
+        return section_only_match.group(1)
+    bare_id_match = BARE_SECTION_ID_RE.match(line_text)
     if bare_id_match and next_line_text:
         title_line = next_line_text
         if (
@@ -1485,43 +1476,11 @@ def detect_section_start_text(
         ):
             return bare_id_match.group(1)
         return None
-    appendix_match = re.match(
-        r"^\s*APPENDIX\s+([A-Z]+)\b(?:\s+(.+))?$",
-        line_text,
-        re.IGNORECASE,
-    )
-    appendix_title = appendix_match.group(2) if appendix_match else None
-    if (
-        appendix_match
-        and appendix_title
-        and not has_dot_leaders(line_text)
-        and title_starts_with_upper_or_digit(appendix_title)
-        and title_has_non_id_text(appendix_title)
-    ):
-        return f"Appendix {appendix_match.group(1)}"
-    header_match = SECTION_HEADER_RE.match(line_text.strip())
-    if (
-        header_match
-        and header_match.group(2)
-        and not re.match(r"^\s*SECTION\b", line_text, re.IGNORECASE)
-        and not has_dot_leaders(line_text)
-        and title_starts_with_upper_or_digit(header_match.group(2))
-        and title_has_non_id_text(header_match.group(2))
-        and not (
-            title_all_caps_no_space(header_match.group(2))
-            and len(header_match.group(2).strip()) > 4
-        )
-    ):
-        return header_match.group(1)
-    return None
+    return appendix_heading_id(line_text) or section_header_heading_id(line_text)
 
 
 def parse_true_section_heading(line_text: str) -> Optional[str]:
-    match = re.match(
-        r"^\s*([A-Z]{1,3}\d{3,4}(?:\.\d+){0,6})\b(.*)$",
-        line_text,
-        re.IGNORECASE,
-    )
+    match = TRUE_SECTION_HEADING_RE.match(line_text)
     if not match:
         return None
     end_idx = match.end(1)
@@ -1536,11 +1495,7 @@ def parse_true_section_heading(line_text: str) -> Optional[str]:
 
 
 def parse_section_marker_line(line_text: str) -> Optional[str]:
-    match = re.match(
-        r"^\s*SECTION\s+([A-Z]{1,3}\d{3,4}(?:\.\d+){0,6})\b",
-        line_text,
-        re.IGNORECASE,
-    )
+    match = SECTION_MARKER_RE.match(line_text)
     if not match:
         return None
     return match.group(1)
@@ -1549,7 +1504,7 @@ def parse_section_marker_line(line_text: str) -> Optional[str]:
 def is_strict_header_line_text(line_text: str) -> bool:
     if SECTION_TEXT_RE.match(line_text):
         return True
-    header_match = SECTION_HEADER_RE.match(line_text.strip())
+    header_match = match_section_header(line_text.strip())
     if header_match and header_match.group(2):
         return True
     if re.match(r"^\s*SECTION\s+[A-Z]{1,3}\d{3,4}(?:\.\d+)*\b", line_text, re.IGNORECASE):
@@ -1559,6 +1514,27 @@ def is_strict_header_line_text(line_text: str) -> bool:
     return False
 
 
+# write_section puts exactly these header lines above the body, with no blank separator.
+SECTION_FILE_HEADER_PREFIXES = ("PDF_PAGE:", "SECTION_ID:", "SECTION:")
+
+
+def iter_section_body_lines(path: Path) -> Iterator[Tuple[int, str]]:
+    line_no = 0
+    in_header = True
+    with path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            # splitlines() keeps the line boundaries of read_text().splitlines().
+            for line in raw.splitlines():
+                line_no += 1
+                if in_header:
+                    if line_no <= len(SECTION_FILE_HEADER_PREFIXES) and line.startswith(
+                        SECTION_FILE_HEADER_PREFIXES[line_no - 1]
+                    ):
+                        continue
+                    in_header = False
+                yield line_no, line
+
+
 def enforce_section_integrity(section_ids: List[str], output_dir: Path) -> None:
     if not section_ids:
         return
@@ -1569,20 +1545,13 @@ def enforce_section_integrity(section_ids: List[str], output_dir: Path) -> None:
             raise RuntimeError(
                 f"SECTION_INTEGRITY_VIOLATION: missing file for {section_id}"
             )
-        lines = path.read_text(encoding="utf-8").splitlines()
-        body_start = 0
-        for idx, line in enumerate(lines):
-            if line.strip() == "":
-                body_start = idx + 1
-                break
-        body_lines = lines[body_start:]
-        for idx, line in enumerate(body_lines):
+        for line_no, line in iter_section_body_lines(path):
             if not line.strip():
                 continue
             candidate = parse_true_section_heading(line)
             if candidate and candidate != section_id and candidate in section_id_set:
                 raise RuntimeError(
-                    f"SECTION_INTEGRITY_VIOLATION: {path.name} line {idx + body_start + 1} "
+                    f"SECTION_INTEGRITY_VIOLATION: {path.name} line {line_no} "
                     f"file_section={section_id} found={candidate}"
                 )
 
@@ -1592,13 +1561,19 @@ def split_header_footer_words(
 ) -> Tuple[List[Dict], List[Dict]]:
     header_limit = page_height * HEADER_REGION_RATIO
     footer_limit = page_height * (1.0 - FOOTER_REGION_RATIO)
-    header_words = [w for w in words if w["top"] <= header_limit]
-    footer_words = [w for w in words if w["bottom"] >= footer_limit]
+    header_words: List[Dict] = []
+    footer_words: List[Dict] = []
+    for w in words:
+        # A word tall enough to reach both regions belongs to both lists.
+        if w["top"] <= header_limit:
+            header_words.append(w)
+        if w["bottom"] >= footer_limit:
+            footer_words.append(w)
     return header_words, footer_words
 
 
 def words_to_snippet(words: List[Dict]) -> str:
-    ordered = sorted(words, key=lambda w: (w["top"], w["x0"]))
+    ordered = sorted(words, key=itemgetter("top", "x0"))
     return " ".join(w["text"] for w in ordered)
 
 
@@ -1619,12 +1594,14 @@ def scan_for_amendment_indicators(
         )
 
 
-def format_pdf_pages(pages: List[int]) -> str:
+def format_pdf_pages(pages: Sequence[int]) -> str:
     if not pages:
         raise RuntimeError(
             format_error("PDF_PAGE_RANGE", None, "No PDF pages provided.")
         )
-    if pages != list(range(pages[0], pages[-1] + 1)):
+    if pages[-1] - pages[0] + 1 != len(pages) or not all(
+        b == a + 1 for a, b in pairwise(pages)
+    ):
         raise RuntimeError(
             format_error(
                 "PDF_PAGE_RANGE",
@@ -1647,10 +1624,14 @@ def build_label_lines(
     lines = words_to_lines(words, LINE_Y_TOLERANCE, gap_threshold, median_width)
     for line in lines:
         line["column"] = "single"
-    return sorted(lines, key=lambda l: l["top"])
+        # Label lines are checked for TABLE labels several times per page.
+        line["_is_table_label"] = TABLE_LABEL_RE.match(line["_stripped"]) is not None
+    return sorted(lines, key=itemgetter("top"))
 
 
 def inside_any_table(word: Dict, table_bboxes: List[Tuple[float, float, float, float]]) -> bool:
+    if not table_bboxes:
+        return False
     x = (word["x0"] + word["x1"]) / 2.0
     y = (word["top"] + word["bottom"]) / 2.0
     for x0, y0, x1, y1 in table_bboxes:
@@ -1659,38 +1640,46 @@ def inside_any_table(word: Dict, table_bboxes: List[Tuple[float, float, float, f
     return False
 
 
+def objects_outside_tables(
+    objs: List[Dict], table_bboxes: List[Tuple[float, float, float, float]]
+) -> List[Dict]:
+    # Batch form of inside_any_table for whole-page char/word lists.
+    if not table_bboxes:
+        return list(objs)
+    kept: List[Dict] = []
+    for obj in objs:
+        x = (obj["x0"] + obj["x1"]) / 2.0
+        y = (obj["top"] + obj["bottom"]) / 2.0
+        for x0, y0, x1, y1 in table_bboxes:
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                break
+        else:
+            kept.append(obj)
+    return kept
+
+
 def rotation_dimensions(
     width: float, height: float, rotation: int
 ) -> Tuple[float, float]:
     if rotation in (90, 270):
-        return height, width
-    return width, height
-
-
-def rotate_point(x: float, y: float, width: float, height: float, rotation: int) -> Tuple[float, float]:
-    if rotation == 0:
-        return x, y
-    if rotation == 90:
-        return height - y, x
-    if rotation == 270:
-        return y, width - x
-    raise RuntimeError(format_error("ROTATION_INVALID", None, f"rotation={rotation}"))
+        return height, width
+    return width, height
 
 
 def rotate_bbox(
     bbox: Tuple[float, float, float, float], width: float, height: float, rotation: int
 ) -> Tuple[float, float, float, float]:
     x0, top, x1, bottom = bbox
-    points = [
-        (x0, top),
-        (x1, top),
-        (x1, bottom),
-        (x0, bottom),
-    ]
-    rotated = [rotate_point(px, py, width, height, rotation) for px, py in points]
-    xs = [p[0] for p in rotated]
-    ys = [p[1] for p in rotated]
-    return (min(xs), min(ys), max(xs), max(ys))
+    # Points map to (height - y, x) at 90 and (y, width - x) at 270; min/max the corners.
+    if rotation == 0:
+        xa, xb, ya, yb = x0, x1, top, bottom
+    elif rotation == 90:
+        xa, xb, ya, yb = height - top, height - bottom, x0, x1
+    elif rotation == 270:
+        xa, xb, ya, yb = top, bottom, width - x0, width - x1
+    else:
+        raise RuntimeError(format_error("ROTATION_INVALID", None, f"rotation={rotation}"))
+    return (min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb))
 
 
 def unrotate_bbox(
@@ -1716,6 +1705,9 @@ def classify_char_rotation(char: Dict) -> Optional[int]:
     matrix = char.get("matrix")
     if matrix and len(matrix) >= 4:
         a, b, _, _ = matrix[:4]
+        if b == 0 and a > 0:
+            # Unrotated text, the bulk of every page: atan2 would give exactly 0.
+            return 0
         angle = math.degrees(math.atan2(b, a))
         angle = angle % 360.0
         for candidate in (0, 90, 180, 270):
@@ -1727,63 +1719,44 @@ def classify_char_rotation(char: Dict) -> Optional[int]:
     return None
 
 
-def point_in_bbox(x: float, y: float, bbox: Tuple[float, float, float, float]) -> bool:
-    x0, y0, x1, y1 = bbox
-    return x0 <= x <= x1 and y0 <= y <= y1
-
-
 def count_points_in_bboxes(
     points: List[Tuple[float, float]], bboxes: List[Tuple[float, float, float, float]]
 ) -> int:
     if not points or not bboxes:
         return 0
+    # Sorted by top, so the scan for a point stops at the first bbox starting below it.
+    bboxes_by_top = sorted(bboxes, key=itemgetter(1))
     count = 0
     for x, y in points:
-        for bbox in bboxes:
-            if point_in_bbox(x, y, bbox):
+        for x0, y0, x1, y1 in bboxes_by_top:
+            if y0 > y:
+                break
+            if x0 <= x <= x1 and y <= y1:
                 count += 1
                 break
     return count
 
 
-def merge_collinear_lines(lines: List[Dict], orientation: str) -> List[Dict]:
-    grouped: Dict[float, List[Dict]] = {}
-    key_field = "top" if orientation == "h" else "x0"
-    for line in lines:
-        key = line[key_field]
-        grouped.setdefault(key, []).append(line)
-    merged: List[Dict] = []
-    for key in sorted(grouped.keys()):
-        items = grouped[key]
-        if orientation == "h":
-            items.sort(key=lambda l: l["x0"])
-            current = None
-            for line in items:
-                if current is None:
-                    current = dict(line)
-                    continue
-                if line["x0"] - current["x1"] <= RULING_JOIN_TOLERANCE:
-                    current["x1"] = max(current["x1"], line["x1"])
-                else:
-                    merged.append(current)
-                    current = dict(line)
-            if current is not None:
-                merged.append(current)
-        else:
-            items.sort(key=lambda l: l["top"])
-            current = None
-            for line in items:
-                if current is None:
-                    current = dict(line)
-                    continue
-                if line["top"] - current["bottom"] <= RULING_JOIN_TOLERANCE:
-                    current["bottom"] = max(current["bottom"], line["bottom"])
-                else:
-                    merged.append(current)
-                    current = dict(line)
-            if current is not None:
-                merged.append(current)
-    return merged
+# Spans are (position, start, end): y/x0/x1 for horizontals, x/top/bottom for verticals.
+def merge_collinear_lines(
+    spans: List[Tuple[float, float, float]], orientation: str
+) -> List[Dict]:
+    merged: List[Tuple[float, float, float]] = []
+    if spans:
+        # One sort by (position, start) puts each collinear run in merge order.
+        ordered = sorted(spans)
+        current_key, current_start, current_end = ordered[0]
+        for key, start, end in ordered:
+            if key == current_key and start - current_end <= RULING_JOIN_TOLERANCE:
+                current_end = max(current_end, end)
+            else:
+                merged.append((current_key, current_start, current_end))
+                current_key, current_start, current_end = key, start, end
+        merged.append((current_key, current_start, current_end))
+    # Dicts are only built for the merged rulings.
+    if orientation == "h":
+        return [{"x0": x0, "x1": x1, "top": y, "bottom": y} for y, x0, x1 in merged]
+    return [{"x0": x, "x1": x, "top": top, "bottom": bottom} for x, top, bottom in merged]
 
 
 def line_overlaps_bbox(
@@ -1807,13 +1780,13 @@ def line_overlaps_bbox(
     )
 
 
-def get_ruling_lines(page: pdfplumber.page.Page, rotation: int) -> Tuple[List[Dict], List[Dict]]:
-    width = page.width
+def collect_ruling_segments(page: pdfplumber.page.Page) -> List[Tuple[float, float, float, float]]:
     height = page.height
     segments: List[Tuple[float, float, float, float]] = []
-    edges = list(page.edges or [])
-    lines = list(page.lines or [])
-    rects = list(page.rects or [])
+    # Each pdfplumber object property builds a fresh list; read each one once.
+    edges = page.edges or []
+    lines = page.lines or []
+    rects = page.rects or []
     for edge in edges + lines:
         x0 = edge.get("x0")
         x1 = edge.get("x1")
@@ -1847,34 +1820,69 @@ def get_ruling_lines(page: pdfplumber.page.Page, rotation: int) -> Tuple[List[Di
                 (x1, top, x1, bottom),
             ]
         )
-    h_lines: List[Dict] = []
-    v_lines: List[Dict] = []
-    for x0, top, x1, bottom in segments:
-        rx0, rtop = rotate_point(x0, top, width, height, rotation)
-        rx1, rbottom = rotate_point(x1, bottom, width, height, rotation)
+    return segments
+
+
+def ruling_lines_from_segments(
+    segments: List[Tuple[float, float, float, float]],
+    width: float,
+    height: float,
+    rotation: int,
+) -> Tuple[List[Dict], List[Dict]]:
+    # Rotate both endpoints of every segment as rotate_bbox maps points, dispatching once.
+    if rotation == 0:
+        rotated = segments
+    elif rotation == 90:
+        rotated = [(height - top, x0, height - bottom, x1) for x0, top, x1, bottom in segments]
+    elif rotation == 270:
+        rotated = [(top, width - x0, bottom, width - x1) for x0, top, x1, bottom in segments]
+    elif segments:
+        raise RuntimeError(format_error("ROTATION_INVALID", None, f"rotation={rotation}"))
+    else:
+        rotated = []
+    h_spans: List[Tuple[float, float, float]] = []
+    v_spans: List[Tuple[float, float, float]] = []
+    for rx0, rtop, rx1, rbottom in rotated:
         if abs(rtop - rbottom) <= RULING_EPS:
             y = snap_value(rtop)
             x_start = snap_value(min(rx0, rx1))
             x_end = snap_value(max(rx0, rx1))
             if (x_end - x_start) < RULING_MIN_LEN:
                 continue
-            h_lines.append({"x0": x_start, "x1": x_end, "top": y, "bottom": y})
+            h_spans.append((y, x_start, x_end))
         elif abs(rx0 - rx1) <= RULING_EPS:
             x = snap_value(rx0)
             y_start = snap_value(min(rtop, rbottom))
             y_end = snap_value(max(rtop, rbottom))
             if (y_end - y_start) < RULING_MIN_LEN:
                 continue
-            v_lines.append({"x0": x, "x1": x, "top": y_start, "bottom": y_end})
-    h_lines = merge_collinear_lines(h_lines, "h")
-    v_lines = merge_collinear_lines(v_lines, "v")
-    return h_lines, v_lines
+            v_spans.append((x, y_start, y_end))
+    return merge_collinear_lines(h_spans, "h"), merge_collinear_lines(v_spans, "v")
+
+
+def get_ruling_lines(page: pdfplumber.page.Page, rotation: int) -> Tuple[List[Dict], List[Dict]]:
+    return ruling_lines_from_segments(
+        collect_ruling_segments(page), page.width, page.height, rotation
+    )
+
+
+def cached_ruling_lines(
+    page: pdfplumber.page.Page,
+    rotation: int,
+    cache: Optional[Dict[int, Tuple[List[Dict], List[Dict]]]],
+) -> Tuple[List[Dict], List[Dict]]:
+    if cache is None:
+        return get_ruling_lines(page, rotation)
+    if rotation not in cache:
+        cache[rotation] = get_ruling_lines(page, rotation)
+    return cache[rotation]
 
 
 def is_real_ruled_table(
     table_obj: Dict,
     page: pdfplumber.page.Page,
     debug: Optional[List[Dict]] = None,
+    ruling_cache: Optional[Dict[int, Tuple[List[Dict], List[Dict]]]] = None,
 ) -> bool:
     rotation = table_obj.get("rotation", 0)
     if "bbox_rotated" in table_obj:
@@ -1884,10 +1892,10 @@ def is_real_ruled_table(
         if not bbox:
             return False
         bbox_rotated = rotate_bbox(bbox, page.width, page.height, rotation)
-    h_lines, v_lines = get_ruling_lines(page, rotation)
-    h_in = [l for l in h_lines if line_overlaps_bbox(l, bbox_rotated, "h")]
-    v_in = [l for l in v_lines if line_overlaps_bbox(l, bbox_rotated, "v")]
-    ok = len(h_in) >= 2 and len(v_in) >= 2
+    h_lines, v_lines = cached_ruling_lines(page, rotation, ruling_cache)
+    h_in = sum(1 for l in h_lines if line_overlaps_bbox(l, bbox_rotated, "h"))
+    v_in = sum(1 for l in v_lines if line_overlaps_bbox(l, bbox_rotated, "v"))
+    ok = h_in >= 2 and v_in >= 2
     if debug is not None:
         debug.append(
             {
@@ -1895,8 +1903,8 @@ def is_real_ruled_table(
                 "bbox": list(table_obj.get("bbox") or bbox_rotated),
                 "bbox_rotated": list(bbox_rotated),
                 "rotation": rotation,
-                "h_in_bbox": len(h_in),
-                "v_in_bbox": len(v_in),
+                "h_in_bbox": h_in,
+                "v_in_bbox": v_in,
                 "accepted": ok,
             }
         )
@@ -1912,21 +1920,20 @@ def detect_ruled_tables(
     if len(h_lines) < 2 or len(v_lines) < 2:
         return []
     intersections: List[Tuple[int, int]] = []
+    # Verticals sorted by x, so each horizontal only tests those inside its x-span.
+    v_order = sorted(range(len(v_lines)), key=lambda vi: v_lines[vi]["x0"])
+    v_xs = [v_lines[vi]["x0"] for vi in v_order]
+    v_spans = [
+        (v["top"] - RULING_INTERSECTION_TOLERANCE, v["bottom"] + RULING_INTERSECTION_TOLERANCE)
+        for v in v_lines
+    ]
     for hi, h in enumerate(h_lines):
         hy = h["top"]
-        hx0 = h["x0"]
-        hx1 = h["x1"]
-        for vi, v in enumerate(v_lines):
-            vx = v["x0"]
-            if (
-                hx0 - RULING_INTERSECTION_TOLERANCE
-                <= vx
-                <= hx1 + RULING_INTERSECTION_TOLERANCE
-                and v["top"] - RULING_INTERSECTION_TOLERANCE
-                <= hy
-                <= v["bottom"] + RULING_INTERSECTION_TOLERANCE
-            ):
-                intersections.append((hi, vi))
+        start = bisect_left(v_xs, h["x0"] - RULING_INTERSECTION_TOLERANCE)
+        end = bisect_right(v_xs, h["x1"] + RULING_INTERSECTION_TOLERANCE)
+        hits = [vi for vi in v_order[start:end] if v_spans[vi][0] <= hy <= v_spans[vi][1]]
+        hits.sort()
+        intersections.extend((hi, vi) for vi in hits)
     if not intersections:
         return []
     node_count = len(h_lines) + len(v_lines)
@@ -1956,17 +1963,18 @@ def detect_ruled_tables(
         v_indices = [i - len(h_lines) for i in component if i >= len(h_lines)]
         if len(h_indices) < 2 or len(v_indices) < 2:
             continue
-        intersection_count = sum(
-            1 for hi, vi in intersections if hi in h_indices and vi in v_indices
-        )
+        # Every intersection of a component's horizontal lies in the same component,
+        # so its adjacency list holds exactly that horizontal's intersections.
+        intersection_count = sum(len(adj[i]) for i in h_indices)
         if intersection_count < TABLE_INTERSECTION_MIN:
             continue
         comp_h = [h_lines[i] for i in h_indices]
         comp_v = [v_lines[i] for i in v_indices]
-        x0 = min(line["x0"] for line in comp_h + comp_v)
-        x1 = max(line["x1"] for line in comp_h + comp_v)
-        top = min(line["top"] for line in comp_h + comp_v)
-        bottom = max(line["bottom"] for line in comp_h + comp_v)
+        comp_lines = comp_h + comp_v
+        x0 = min(line["x0"] for line in comp_lines)
+        x1 = max(line["x1"] for line in comp_lines)
+        top = min(line["top"] for line in comp_lines)
+        bottom = max(line["bottom"] for line in comp_lines)
         candidates.append(
             {
                 "bbox_rotated": (x0, top, x1, bottom),
@@ -1995,13 +2003,22 @@ def rotate_objects(
         bottom = item.get("bottom")
         if x0 is None or x1 is None or top is None or bottom is None:
             continue
-        bbox_rot = rotate_bbox((x0, top, x1, bottom), width, height, rotation)
-        rotated_item = dict(item)
-        rotated_item["x0"] = bbox_rot[0]
-        rotated_item["top"] = bbox_rot[1]
-        rotated_item["x1"] = bbox_rot[2]
-        rotated_item["bottom"] = bbox_rot[3]
-        rotated.append(rotated_item)
+        # Inlined rotate_bbox; existing keys keep their position in the copied dict.
+        if rotation == 90:
+            xa, xb, ya, yb = height - top, height - bottom, x0, x1
+        elif rotation == 270:
+            xa, xb, ya, yb = top, bottom, width - x0, width - x1
+        else:
+            raise RuntimeError(format_error("ROTATION_INVALID", None, f"rotation={rotation}"))
+        rotated.append(
+            {
+                **item,
+                "x0": min(xa, xb),
+                "top": min(ya, yb),
+                "x1": max(xa, xb),
+                "bottom": max(ya, yb),
+            }
+        )
     return rotated
 
 
@@ -2009,22 +2026,17 @@ def unique_sorted_positions(values: List[float], tolerance: float) -> List[float
     if not values:
         return []
     values_sorted = sorted(values)
-    merged = [values_sorted[0]]
-    for value in values_sorted[1:]:
-        if abs(value - merged[-1]) > tolerance:
+    last = values_sorted[0]
+    merged = [last]
+    for value in values_sorted:
+        if abs(value - last) > tolerance:
             merged.append(value)
+            last = value
     return merged
 
 
 def median_char_width_for_words(words: List[Dict]) -> float:
-    widths: List[float] = []
-    for w in words:
-        text = w.get("text") or ""
-        if not text:
-            continue
-        width = (w["x1"] - w["x0"]) / max(len(text), 1)
-        if width > 0:
-            widths.append(width)
+    widths = char_widths(words)
     if not widths:
         return 1.0
     return median(widths)
@@ -2051,26 +2063,27 @@ def extract_table_cells_from_grid(
             "col_count": 0,
             "reason": "grid_insufficient",
         }
-    words_in_bbox = []
+    row_cell_count = len(h_positions) - 1
+    col_cell_count = len(v_positions) - 1
+    words_by_cell: Dict[Tuple[int, int], List[Dict]] = {}
     for w in words:
         wx = (w["x0"] + w["x1"]) / 2.0
         wy = (w["top"] + w["bottom"]) / 2.0
-        if x0 <= wx <= x1 and top <= wy <= bottom:
-            words_in_bbox.append(w)
+        if not (x0 <= wx <= x1 and top <= wy <= bottom):
+            continue
+        # Cells are closed intervals, so a center on a grid line lands in both neighbours.
+        row_start = max(bisect_left(h_positions, wy) - 1, 0)
+        row_end = min(bisect_right(h_positions, wy), row_cell_count)
+        col_start = max(bisect_left(v_positions, wx) - 1, 0)
+        col_end = min(bisect_right(v_positions, wx), col_cell_count)
+        for r in range(row_start, row_end):
+            for c in range(col_start, col_end):
+                words_by_cell.setdefault((r, c), []).append(w)
     rows: List[List[str]] = []
-    for r in range(len(h_positions) - 1):
+    for r in range(row_cell_count):
         row_cells: List[str] = []
-        cell_top = h_positions[r]
-        cell_bottom = h_positions[r + 1]
-        for c in range(len(v_positions) - 1):
-            cell_x0 = v_positions[c]
-            cell_x1 = v_positions[c + 1]
-            cell_words = [
-                w
-                for w in words_in_bbox
-                if cell_x0 <= (w["x0"] + w["x1"]) / 2.0 <= cell_x1
-                and cell_top <= (w["top"] + w["bottom"]) / 2.0 <= cell_bottom
-            ]
+        for c in range(col_cell_count):
+            cell_words = words_by_cell.get((r, c))
             if cell_words:
                 median_width = median_char_width_for_words(cell_words)
                 gap_threshold = median_width * WORD_GAP_MULTIPLIER
@@ -2106,53 +2119,69 @@ def extract_table_cells_from_grid(
 def extract_tables_with_rotation(
     page: pdfplumber.page.Page,
     words: List[Dict],
+    chars: List[Dict],
     page_num: int,
+    ruling_cache: Optional[Dict[int, Tuple[List[Dict], List[Dict]]]] = None,
+    rotated_words_cache: Optional[Dict[int, List[Dict]]] = None,
 ) -> Tuple[List[Dict], Dict]:
     width = page.width
     height = page.height
-    char_points_by_angle: Dict[int, List[Tuple[float, float]]] = {0: [], 90: [], 180: [], 270: []}
-    for c in page.chars:
-        char_rotation = classify_char_rotation(c)
-        if char_rotation is None:
-            continue
-        x0 = c.get("x0")
-        x1 = c.get("x1")
-        top = c.get("top")
-        bottom = c.get("bottom")
-        if x0 is None or x1 is None or top is None or bottom is None:
-            continue
-        cx = (x0 + x1) / 2.0
-        cy = (top + bottom) / 2.0
-        char_points_by_angle[char_rotation].append((cx, cy))
     rotation_results: List[Dict] = []
     rotations = [0, 90, 270]
+    # Page segments are rotation-independent; collect them once for all three passes.
+    segments = collect_ruling_segments(page)
     for rotation in rotations:
-        h_lines, v_lines = get_ruling_lines(page, rotation)
+        h_lines, v_lines = ruling_lines_from_segments(segments, width, height, rotation)
+        if ruling_cache is not None:
+            ruling_cache[rotation] = (h_lines, v_lines)
         candidates = detect_ruled_tables(h_lines, v_lines, rotation, page_num)
         total_intersections = sum(c["intersection_count"] for c in candidates)
         total_area = 0.0
         for c in candidates:
             x0, top, x1, bottom = c["bbox_rotated"]
             total_area += max(0.0, (x1 - x0) * (bottom - top))
-        target_angle = (360 - rotation) % 360
-        bboxes_orig = [
-            unrotate_bbox(c["bbox_rotated"], width, height, rotation) for c in candidates
-        ]
-        orientation_score = count_points_in_bboxes(
-            char_points_by_angle.get(target_angle, []), bboxes_orig
-        )
         rotation_results.append(
             {
                 "rotation": rotation,
                 "candidates": candidates,
                 "total_intersections": total_intersections,
                 "total_area": total_area,
-                "orientation_score": orientation_score,
-                "orientation_target": target_angle,
+                "orientation_score": 0,
+                "orientation_target": (360 - rotation) % 360,
                 "h_line_count": len(h_lines),
                 "v_line_count": len(v_lines),
             }
         )
+    # Orientation scores count chars inside candidates; text-only pages have none to score.
+    if any(r["candidates"] for r in rotation_results):
+        char_points_by_angle: Dict[int, List[Tuple[float, float]]] = {
+            0: [],
+            90: [],
+            180: [],
+            270: [],
+        }
+        for c in chars:
+            char_rotation = classify_char_rotation(c)
+            if char_rotation is None:
+                continue
+            x0 = c.get("x0")
+            x1 = c.get("x1")
+            top = c.get("top")
+            bottom = c.get("bottom")
+            if x0 is None or x1 is None or top is None or bottom is None:
+                continue
+            cx = (x0 + x1) / 2.0
+            cy = (top + bottom) / 2.0
+            char_points_by_angle[char_rotation].append((cx, cy))
+        for result in rotation_results:
+            rotation = result["rotation"]
+            bboxes_orig = [
+                unrotate_bbox(c["bbox_rotated"], width, height, rotation)
+                for c in result["candidates"]
+            ]
+            result["orientation_score"] = count_points_in_bboxes(
+                char_points_by_angle.get(result["orientation_target"], []), bboxes_orig
+            )
     rotation_results.sort(
         key=lambda r: (
             r["orientation_score"],
@@ -2193,7 +2222,13 @@ def extract_tables_with_rotation(
         }
     chosen_rotation = best["rotation"]
     rot_width, rot_height = rotation_dimensions(width, height, chosen_rotation)
-    rotated_words = rotate_objects(words, width, height, chosen_rotation)
+    # Cell extraction only reads the words, so upright tables need no rotated copies.
+    if chosen_rotation == 0:
+        rotated_words = words
+    else:
+        rotated_words = rotate_objects(words, width, height, chosen_rotation)
+    if rotated_words_cache is not None:
+        rotated_words_cache[chosen_rotation] = rotated_words
     inverse_rotation = 0
     if chosen_rotation == 90:
         inverse_rotation = 270
@@ -2228,33 +2263,29 @@ def find_table_label_for_bbox(
         line_x1 = line.get("x1", line["x0"])
         return not (line_x1 < x0 or line_x0 > x1)
 
-    labels = []
-    for line in label_lines:
-        line_text = line["text"].strip()
-        match = TABLE_LABEL_RE.match(line_text)
-        if match and overlaps(line):
-            labels.append({"line": line, "match": match})
+    # Only the chosen label is re-matched for its id and title.
+    labels = [line for line in label_lines if line["_is_table_label"] and overlaps(line)]
 
     above = [
         l
         for l in labels
-        if l["line"]["bottom"] <= y0
-        and y0 - l["line"]["bottom"] <= TABLE_LABEL_SEARCH_WINDOW
+        if l["bottom"] <= y0
+        and y0 - l["bottom"] <= TABLE_LABEL_SEARCH_WINDOW
     ]
     chosen = None
     search_region = "above"
     if above:
-        above.sort(key=lambda l: l["line"]["bottom"])
+        above.sort(key=itemgetter("bottom"))
         chosen = above[-1]
     else:
         band_height = (y1 - y0) * TABLE_LABEL_TOP_BAND_RATIO
         inside_band = [
             l
             for l in labels
-            if y0 <= l["line"]["top"] <= (y0 + band_height)
+            if y0 <= l["top"] <= (y0 + band_height)
         ]
         if inside_band:
-            inside_band.sort(key=lambda l: l["line"]["top"])
+            inside_band.sort(key=itemgetter("top"))
             chosen = inside_band[0]
             search_region = "inside_top_band"
 
@@ -2263,23 +2294,23 @@ def find_table_label_for_bbox(
             debug.append(
                 {
                     "bbox": {"x0": x0, "y0": y0, "x1": x1, "y1": y1},
-                    "labels_found": [l["line"]["text"] for l in labels],
+                    "labels_found": [l["text"] for l in labels],
                     "chosen_label": None,
                     "search_region": None,
                 }
             )
         return None, None, None, False
 
-    line = chosen["line"]
-    match = chosen["match"]
+    line = chosen
+    match = TABLE_LABEL_RE.match(line["_stripped"])
     table_id = match.group(1).strip()
     title = (match.group(2) or "").strip()
-    continued = "CONTINUED" in line["text"].upper()
+    continued = "CONTINUED" in line["_upper"]
     if debug is not None:
         debug.append(
             {
                 "bbox": {"x0": x0, "y0": y0, "x1": x1, "y1": y1},
-                "labels_found": [l["line"]["text"] for l in labels],
+                "labels_found": [l["text"] for l in labels],
                 "chosen_label": line["text"],
                 "search_region": search_region,
                 "table_id": table_id,
@@ -2293,29 +2324,99 @@ def find_table_label_for_bbox(
 def has_continued_marker(label_lines: List[Dict], table_id: str) -> bool:
     target = table_id.upper()
     for line in label_lines:
-        text = line["text"].upper()
+        text = line["_upper"]
         if "TABLE" in text and target in text and "CONTINUED" in text:
             return True
     return False
 
 
+# Set while buffered_output_writes() is active; files then go through a writer thread.
+OUTPUT_WRITE_QUEUE: Optional[queue.Queue] = None
+OUTPUT_WRITE_ERRORS: List[Exception] = []
+OUTPUT_WRITE_QUEUE_SIZE = 128
+
+
+def write_output_file(path: Path, data: Union[str, bytes], newline: Optional[str]) -> None:
+    if isinstance(data, bytes):
+        path.write_bytes(data)
+        return
+    with path.open("w", encoding="utf-8", newline=newline) as handle:
+        handle.write(data)
+
+
+def write_output_text(path: Path, text: str, newline: Optional[str] = None) -> None:
+    if OUTPUT_WRITE_QUEUE is None:
+        write_output_file(path, text, newline)
+        return
+    OUTPUT_WRITE_QUEUE.put((path, text, newline))
+
+
+def write_output_bytes(path: Path, data: bytes) -> None:
+    if OUTPUT_WRITE_QUEUE is None:
+        write_output_file(path, data, None)
+        return
+    OUTPUT_WRITE_QUEUE.put((path, data, None))
+
+
+def run_output_writer(write_queue: queue.Queue) -> None:
+    while True:
+        job = write_queue.get()
+        try:
+            if job is None:
+                return
+            # After a failed write the remaining files are dropped; the error is re-raised.
+            if not OUTPUT_WRITE_ERRORS:
+                write_output_file(*job)
+        except Exception as exc:
+            OUTPUT_WRITE_ERRORS.append(exc)
+        finally:
+            write_queue.task_done()
+
+
+def flush_output_writes() -> None:
+    if OUTPUT_WRITE_QUEUE is not None:
+        OUTPUT_WRITE_QUEUE.join()
+    if OUTPUT_WRITE_ERRORS:
+        raise OUTPUT_WRITE_ERRORS[0]
+
+
+@contextmanager
+def buffered_output_writes() -> Iterator[None]:
+    global OUTPUT_WRITE_QUEUE
+    OUTPUT_WRITE_ERRORS.clear()
+    write_queue: queue.Queue = queue.Queue(maxsize=OUTPUT_WRITE_QUEUE_SIZE)
+    writer = threading.Thread(target=run_output_writer, args=(write_queue,), daemon=True)
+    writer.start()
+    OUTPUT_WRITE_QUEUE = write_queue
+    try:
+        yield
+    finally:
+        OUTPUT_WRITE_QUEUE = None
+        write_queue.put(None)
+        writer.join()
+    flush_output_writes()
+
+
 def write_section(
     section_id: str,
     chapter: str,
-    pdf_pages: List[int],
+    pdf_pages: Sequence[int],
     lines: List[str],
 ) -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"section_{section_id}.txt"
     path = OUTPUT_DIR / filename
-    header = [
-        f"PDF_PAGE: {format_pdf_pages(pdf_pages)}",
-        f"SECTION_ID: {section_id}",
-        f"SECTION: IRC 2021 | {chapter} | Section {section_id}",
-        "",
-    ]
-    body = "\n".join(lines)
-    path.write_text("\n".join(header) + body + "\n", encoding="utf-8")
+    # Section bodies are never empty (the heading line opens them), so one join builds the file.
+    text = "\n".join(
+        [
+            f"PDF_PAGE: {format_pdf_pages(pdf_pages)}",
+            f"SECTION_ID: {section_id}",
+            f"SECTION: IRC 2021 | {chapter} | Section {section_id}",
+            *lines,
+            "",
+        ]
+    )
+    write_output_text(path, text)
 
 
 def write_table(
@@ -2347,13 +2448,13 @@ def write_table(
     lines.append("FOOTNOTES:")
     for note in footnotes:
         lines.append(f"- {note}")
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_output_text(path, "\n".join(lines) + "\n")
     csv_path = OUTPUT_DIR / f"table_{table_id}.csv"
-    with csv_path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(columns)
-        for row in rows:
-            writer.writerow(row)
+    csv_buffer = io.StringIO(newline="")
+    writer = csv.writer(csv_buffer)
+    writer.writerow(columns)
+    writer.writerows(rows)
+    write_output_text(csv_path, csv_buffer.getvalue(), newline="")
     json_path = OUTPUT_DIR / f"table_{table_id}.json"
     meta = {
         "pdf_pages": pdf_pages,
@@ -2365,7 +2466,7 @@ def write_table(
     }
     if metadata:
         meta.update(metadata)
-    json_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    write_output_text(json_path, json.dumps(meta, indent=2))
 
 
 def write_fallback_page(page_num: int, lines: List[str]) -> None:
@@ -2378,7 +2479,7 @@ def write_fallback_page(page_num: int, lines: List[str]) -> None:
         "--------------------------------",
     ]
     body = "\n".join(lines)
-    path.write_text("\n".join(header) + "\n" + body + "\n", encoding="utf-8")
+    write_output_text(path, "\n".join(header) + "\n" + body + "\n")
 
 
 def clean_cell(cell: Optional[str]) -> str:
@@ -2388,6 +2489,9 @@ def clean_cell(cell: Optional[str]) -> str:
 
 
 def compute_pdf_sha256(pdf_path: Path) -> str:
+    if sys.version_info >= (3, 11):
+        with pdf_path.open("rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
     hasher = hashlib.sha256()
     with pdf_path.open("rb") as handle:
         for chunk in iter(lambda: handle.read(1024 * 1024), b""):
@@ -2395,6 +2499,373 @@ def compute_pdf_sha256(pdf_path: Path) -> str:
     return hasher.hexdigest()
 
 
+# Page-local work (no cross-page state, no output writes), so pages can run in any process.
+# Returns a picklable dict: page_entry, page_width, page_height, header_text_snippet,
+# footer_text_snippet, column_bounds, label_candidates and error (the exception, or None).
+# When error is None it also carries is_toc_page, tables, chosen_rotation, ordered_lines,
+# label_lines_original, rotated_label_lines, table_ruled_filter, and the debug-only
+# rotation_results and table_debug_png (PNG bytes), which stay None without debug_dump.
+def extract_page_layout(page: pdfplumber.page.Page, page_num: int, debug_dump: bool) -> Dict:
+    page_width = page.width
+    page_height = page.height
+    page_entry = {
+        "pdf_page": page_num,
+        "header_text_snippet": None,
+        "footer_text_snippet": None,
+        "column_bounds": None,
+        "thresholds": {},
+        "warnings": [],
+        "errors": [],
+        "spanning_reference_lines": [],
+        "table_label_bindings": [],
+        "table_continuation": [],
+        "tables_found": [],
+        "column_split_debug": [],
+    }
+    header_text_snippet = ""
+    footer_text_snippet = ""
+    column_bounds: Dict[str, float] = {}
+    label_candidates: List[Dict] = []
+    layout: Dict = {
+        "page_entry": page_entry,
+        "page_width": page_width,
+        "page_height": page_height,
+        "error": None,
+    }
+    try:
+        word_tokens = page.extract_words(
+            use_text_flow=False,
+            keep_blank_chars=False,
+            extra_attrs=["x0", "x1", "top", "bottom", "size", "fontname"],
+        )
+        chars_all = page.chars
+        if not chars_all:
+            raise RuntimeError(
+                format_error(
+                    "CHAR_DATA_MISSING",
+                    page_num,
+                    "No character data on page.",
+                )
+            )
+        # Font metadata is required for header-style validation; missing data is unsafe.
+        bad_char = next(
+            (c for c in chars_all if c.get("size") is None or c.get("fontname") is None),
+            None,
+        )
+        if bad_char is not None:
+            raise RuntimeError(
+                format_error(
+                    "FONT_METADATA_MISSING",
+                    page_num,
+                    "Missing font metadata; cannot validate headers.",
+                    stats={"char": bad_char},
+                )
+            )
+        header_words, footer_words = split_header_footer_words(word_tokens, page_height)
+        header_text_snippet = words_to_snippet(header_words)
+        footer_text_snippet = words_to_snippet(footer_words)
+        if not header_words and not footer_words:
+            raise RuntimeError(
+                format_error(
+                    "HEADER_FOOTER_MISSING",
+                    page_num,
+                    "Missing header/footer content.",
+                )
+            )
+        scan_for_amendment_indicators(
+            page_num, header_text_snippet, footer_text_snippet
+        )
+        page_entry["header_text_snippet"] = header_text_snippet
+        page_entry["footer_text_snippet"] = footer_text_snippet
+        is_toc_page = is_table_of_contents_header(header_text_snippet)
+        # Ruling lines and rotated words per rotation, computed once per page.
+        ruling_cache: Dict[int, Tuple[List[Dict], List[Dict]]] = {}
+        rotated_words_cache: Dict[int, List[Dict]] = {}
+        table_candidates, table_rotation_debug = extract_tables_with_rotation(
+            page, word_tokens, chars_all, page_num, ruling_cache, rotated_words_cache
+        )
+        for idx, c in enumerate(table_candidates, start=1):
+            c["table_index"] = idx
+        # Only the debug dump reads the ruled-filter trace; skip building it otherwise.
+        table_ruled_filter: Optional[List[Dict]] = [] if debug_dump else None
+        real_tables = [
+            c
+            for c in table_candidates
+            if is_real_ruled_table(c, page, table_ruled_filter, ruling_cache)
+        ]
+        if table_rotation_debug.get("tie_breaker"):
+            page_entry["warnings"].append(
+                f"TABLE_ROTATION_TIE_DEFAULT PDF_PAGE={page_num} method={table_rotation_debug['tie_breaker']}"
+            )
+        chosen_rotation = table_rotation_debug.get("chosen_rotation")
+        if chosen_rotation is None:
+            chosen_rotation = 0
+        real_table_ids = {id(c) for c in real_tables}
+        for c in table_candidates:
+            c["is_real_ruled"] = id(c) in real_table_ids
+        tables = [c for c in real_tables if c["extraction"]["ok"]]
+        table_bboxes = [c["bbox"] for c in real_tables]
+        for idx, c in enumerate(table_candidates, start=1):
+            extraction = c["extraction"]
+            if not extraction["ok"]:
+                warning = (
+                    f"TABLE_EXTRACTION_DEGENERATE PDF_PAGE={page_num} "
+                    f"bbox={list(c['bbox'])} reason={extraction['reason']}"
+                )
+                page_entry["warnings"].append(warning)
+            page_entry["tables_found"].append(
+                {
+                    "table_index": idx,
+                    "bbox": list(c["bbox"]),
+                    "rotation": c["rotation"],
+                    "intersection_count": c["intersection_count"],
+                    "confidence_reason": c["confidence_reason"],
+                    "extraction": {
+                        "ok": extraction["ok"],
+                        "row_count": extraction["row_count"],
+                        "col_count": extraction["col_count"],
+                        "empty_ratio": extraction["empty_ratio"],
+                        "reason": extraction["reason"],
+                    },
+                    "real_ruled": c.get("is_real_ruled", False),
+                }
+            )
+
+        chars_no_tables = objects_outside_tables(chars_all, table_bboxes)
+        words_no_tables = objects_outside_tables(word_tokens, table_bboxes)
+        if debug_dump:
+            exclusion_debug = []
+            char_centers = [
+                ((ch["x0"] + ch["x1"]) / 2.0, (ch["top"] + ch["bottom"]) / 2.0)
+                for ch in chars_all
+            ]
+            for c in real_tables:
+                bbox = c["bbox"]
+                bx0, by0, bx1, by1 = bbox
+                in_bbox = sum(
+                    1 for x, y in char_centers if bx0 <= x <= bx1 and by0 <= y <= by1
+                )
+                exclusion_debug.append(
+                    {
+                        "table_index": c["table_index"],
+                        "bbox": list(bbox),
+                        "chars_in_bbox": in_bbox,
+                        # chars_no_tables uses the same center test, so every char in bbox was dropped.
+                        "chars_excluded": in_bbox,
+                    }
+                )
+            page_entry["table_char_exclusion"] = exclusion_debug
+        header_limit = page_height * HEADER_REGION_RATIO
+        footer_limit = page_height * (1.0 - FOOTER_REGION_RATIO)
+        body_sizes = [
+            c["size"]
+            for c in chars_no_tables
+            if header_limit < c["top"] < footer_limit
+            and isinstance(c.get("size"), (int, float))
+        ]
+        if not body_sizes:
+            warning = (
+                f"NO_BODY_CONTENT PDF_PAGE={page_num} detail=No body chars in page body region."
+            )
+            page_entry["warnings"].append(warning)
+            body_median_size = None
+            ordered_lines = []
+            column_bounds = {}
+        else:
+            body_median_size = median(body_sizes)
+            ordered_lines, column_bounds = build_ordered_lines(
+                chars_no_tables,
+                words_no_tables,
+                page_width,
+                page_height,
+                page_num,
+                body_median_size,
+                table_bboxes,
+                page_entry["column_split_debug"],
+            )
+            if not column_bounds:
+                raise RuntimeError(
+                    format_error(
+                        "COLUMN_BOUNDS_MISSING",
+                        page_num,
+                        "Missing column bounds.",
+                    )
+                )
+            page_entry["column_bounds"] = column_bounds
+            page_entry["spanning_reference_lines"] = [
+                {
+                    "text": line["text"],
+                    "bbox": [
+                        line["x0"],
+                        line["top"],
+                        line.get("x1"),
+                        line.get("bottom"),
+                    ],
+                    "role": line.get("role"),
+                }
+                for line in ordered_lines
+                if line.get("role") == "spanning_reference"
+            ]
+        label_lines_original = build_label_lines(word_tokens, page_num)
+        rotated_label_lines = label_lines_original
+        # Upright tables bind labels in page coordinates, which label_lines_original already holds.
+        if table_candidates and chosen_rotation != 0:
+            rotated_words = rotated_words_cache[chosen_rotation]
+            rotated_label_lines = build_label_lines(rotated_words, page_num)
+        label_candidates = [
+            {
+                "text": line["text"],
+                "top": line["top"],
+                "x0": line["x0"],
+                "x1": line.get("x1"),
+                "column": line.get("column"),
+            }
+            for line in label_lines_original
+            if line["_is_table_label"]
+        ]
+        page_entry["thresholds"] = {
+            "header_region_ratio": HEADER_REGION_RATIO,
+            "footer_region_ratio": FOOTER_REGION_RATIO,
+            "line_y_tolerance": LINE_Y_TOLERANCE,
+            "column_margin_tolerance": COLUMN_MARGIN_TOLERANCE,
+            "header_body_indent_min": HEADER_BODY_INDENT_MIN,
+            "header_size_delta": HEADER_SIZE_DELTA,
+            "max_header_line_gap": MAX_HEADER_LINE_GAP,
+            "body_median_font_size": body_median_size,
+            "spacing_thresholds": column_bounds.get("spacing_thresholds"),
+            "margin_percentile": column_bounds.get("margin_percentile"),
+            "table_edge_tolerance": TABLE_EDGE_TOLERANCE,
+        }
+
+        layout.update(
+            {
+                "is_toc_page": is_toc_page,
+                "tables": tables,
+                "chosen_rotation": chosen_rotation,
+                "ordered_lines": ordered_lines,
+                "label_lines_original": label_lines_original,
+                "rotated_label_lines": rotated_label_lines,
+                "table_ruled_filter": table_ruled_filter,
+                "rotation_results": None,
+                "table_debug_png": None,
+            }
+        )
+        if debug_dump:
+            layout["rotation_results"] = [
+                {
+                    "rotation": r["rotation"],
+                    "total_intersections": r["total_intersections"],
+                    "total_area": r["total_area"],
+                    "orientation_score": r.get("orientation_score"),
+                    "orientation_target": r.get("orientation_target"),
+                    "h_line_count": r["h_line_count"],
+                    "v_line_count": r["v_line_count"],
+                    "candidate_count": len(r["candidates"]),
+                }
+                for r in table_rotation_debug.get("rotation_results", [])
+            ]
+            if table_candidates:
+                img = page.to_image(resolution=150)
+                img.draw_rects([c["bbox"] for c in table_candidates], stroke="red")
+                png = io.BytesIO()
+                img.save(png, format="PNG")
+                layout["table_debug_png"] = png.getvalue()
+    except Exception as exc:
+        layout["error"] = exc
+    layout.update(
+        {
+            "header_text_snippet": header_text_snippet,
+            "footer_text_snippet": footer_text_snippet,
+            "column_bounds": column_bounds,
+            "label_candidates": label_candidates,
+        }
+    )
+    return layout
+
+
+# Per-process PDF handle for pool workers, opened once by the pool initializer.
+WORKER_PDF: Optional[pdfplumber.PDF] = None
+# Pages handed to a worker per round trip; layouts are large, so keep batches small.
+WORKER_PAGE_CHUNK = 4
+# Batches in flight per worker; bounds how many finished layouts wait in the parent.
+WORKER_BATCHES_AHEAD = 2
+
+
+def open_worker_pdf(pdf_path: str) -> None:
+    global WORKER_PDF
+    WORKER_PDF = pdfplumber.open(pdf_path)
+
+
+def extract_worker_page_layout(page_num: int, debug_dump: bool) -> Dict:
+    layout = extract_page_layout(WORKER_PDF.pages[page_num - 1], page_num, debug_dump)
+    if layout["error"] is not None:
+        # Only the message crosses the process boundary; not every parser exception pickles.
+        layout["error"] = RuntimeError(str(layout["error"]))
+    return layout
+
+
+def extract_worker_page_layouts(page_nums: List[int], debug_dump: bool) -> List[Dict]:
+    return [extract_worker_page_layout(page_num, debug_dump) for page_num in page_nums]
+
+
+def extract_pdf_page_layout(pdf: pdfplumber.PDF, page_num: int, debug_dump: bool) -> Dict:
+    return extract_page_layout(pdf.pages[page_num - 1], page_num, debug_dump)
+
+
+def iter_page_layouts(
+    pdf: pdfplumber.PDF,
+    pdf_path: Path,
+    page_nums: range,
+    workers: int,
+    debug_dump: bool,
+) -> Iterator[Dict]:
+    # Each worker reopens the PDF, so never start more of them than there are pages.
+    workers = min(workers, len(page_nums))
+    if workers <= 1 and not debug_dump:
+        for page_num in page_nums:
+            yield extract_page_layout(pdf.pages[page_num - 1], page_num, debug_dump)
+        return
+    if workers <= 1:
+        # Debug PNG rendering is slow; build the next page's layout while this one is consumed.
+        # Only the single helper thread touches the PDF, one page at a time.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = None
+            for page_num in page_nums:
+                next_future = executor.submit(extract_pdf_page_layout, pdf, page_num, debug_dump)
+                if future is not None:
+                    yield future.result()
+                future = next_future
+            if future is not None:
+                yield future.result()
+        return
+    batches = (
+        page_nums[start : start + WORKER_PAGE_CHUNK]
+        for start in range(0, len(page_nums), WORKER_PAGE_CHUNK)
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=open_worker_pdf, initargs=(str(pdf_path),)
+    ) as executor:
+        # A bounded window of batches, consumed in page order; closing this generator
+        # cancels the batches not yet started.
+        pending: deque = deque()
+        try:
+            for batch in islice(batches, workers * WORKER_BATCHES_AHEAD):
+                pending.append(
+                    executor.submit(extract_worker_page_layouts, list(batch), debug_dump)
+                )
+            while pending:
+                layouts = pending.popleft().result()
+                batch = next(batches, None)
+                if batch is not None:
+                    pending.append(
+                        executor.submit(extract_worker_page_layouts, list(batch), debug_dump)
+                    )
+                yield from layouts
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Extract IRC 2021 sections and tables.")
     parser.add_argument(
@@ -2406,9 +2877,47 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--page-start", type=int, default=None)
     parser.add_argument("--page-end", type=int, default=None)
     parser.add_argument("--debug-dump", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
     return parser.parse_args()
 
 
+def write_debug_json(path: Path, payload: Dict) -> None:
+    # Encoded here, while the payload's lists are settled; the file write itself is queued.
+    write_output_text(path, json.dumps(payload, indent=2))
+
+
+def build_page_debug_payload(
+    page_num: int,
+    page_entry: Dict,
+    header_text_snippet: str,
+    footer_text_snippet: str,
+    column_bounds: Dict,
+    label_candidates: List[Dict],
+    table_label_bindings: List[Dict],
+    table_continuation_debug: List[Dict],
+    section_debug: List[Dict],
+    include_errors: bool = False,
+) -> Dict:
+    payload = {
+        "pdf_page": page_num,
+        "header_text_snippet": header_text_snippet,
+        "footer_text_snippet": footer_text_snippet,
+        "warnings": page_entry["warnings"],
+        "column_bounds": column_bounds or None,
+        "thresholds": page_entry.get("thresholds"),
+        "spanning_reference_lines": page_entry.get("spanning_reference_lines"),
+        "table_label_candidates": label_candidates,
+        "table_label_bindings": table_label_bindings,
+        "table_continuation": table_continuation_debug,
+        "column_split_debug": page_entry.get("column_split_debug"),
+        "tables_found": page_entry.get("tables_found"),
+        "section_candidates": section_debug,
+    }
+    if include_errors:
+        payload["errors"] = page_entry["errors"]
+    return payload
+
+
 def write_report(report_path: Path, report: Dict) -> None:
     report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
 
@@ -2433,6 +2942,14 @@ def main() -> int:
                 f"PDF not found: {pdf_path}",
             )
         )
+    if args.workers < 1:
+        raise RuntimeError(
+            format_error(
+                "WORKERS_INVALID",
+                None,
+                f"--workers must be at least 1 (got {args.workers}).",
+            )
+        )
     global OUTPUT_DIR
     OUTPUT_DIR = Path(args.out)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -2482,7 +2999,7 @@ def main() -> int:
     last_table_id_by_base: Dict[str, str] = {}
     fallback_pages: Dict[int, List[str]] = {}
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with pdfplumber.open(pdf_path) as pdf, buffered_output_writes():
         total_pages = len(pdf.pages)
         page_start = args.page_start or 1
         page_end = args.page_end or total_pages
@@ -2507,228 +3024,29 @@ def main() -> int:
         if args.debug_dump:
             debug_dir.mkdir(parents=True, exist_ok=True)
 
-        for page_num in range(page_start, page_end + 1):
-            page = pdf.pages[page_num - 1]
-            page_width = page.width
-            page_height = page.height
-
-            page_entry = {
-                "pdf_page": page_num,
-                "header_text_snippet": None,
-                "footer_text_snippet": None,
-                "column_bounds": None,
-                "thresholds": {},
-                "warnings": [],
-                "errors": [],
-                "spanning_reference_lines": [],
-                "table_label_bindings": [],
-                "table_continuation": [],
-                "tables_found": [],
-                "column_split_debug": [],
-            }
-            header_text_snippet = ""
-            footer_text_snippet = ""
-            column_bounds: Dict[str, float] = {}
-            label_candidates: List[Dict] = []
+        page_nums = range(page_start, page_end + 1)
+        page_layouts = iter_page_layouts(pdf, pdf_path, page_nums, args.workers, args.debug_dump)
+        page_error: Optional[Tuple[str, Exception]] = None
+        for page_num, layout in zip(page_nums, page_layouts):
+            page_entry = layout["page_entry"]
+            page_width = layout["page_width"]
+            page_height = layout["page_height"]
+            header_text_snippet = layout["header_text_snippet"]
+            footer_text_snippet = layout["footer_text_snippet"]
+            column_bounds = layout["column_bounds"]
+            label_candidates = layout["label_candidates"]
             table_label_bindings: List[Dict] = []
             table_continuation_debug: List[Dict] = []
             section_debug: List[Dict] = []
             try:
-                word_tokens = page.extract_words(
-                    use_text_flow=False,
-                    keep_blank_chars=False,
-                    extra_attrs=["x0", "x1", "top", "bottom", "size", "fontname"],
-                )
-                chars_all = page.chars
-                if not chars_all:
-                    raise RuntimeError(
-                        format_error(
-                            "CHAR_DATA_MISSING",
-                            page_num,
-                            "No character data on page.",
-                        )
-                    )
-                # Font metadata is required for header-style validation; missing data is unsafe.
-                for c in chars_all:
-                    if c.get("size") is None or c.get("fontname") is None:
-                        raise RuntimeError(
-                            format_error(
-                                "FONT_METADATA_MISSING",
-                                page_num,
-                                "Missing font metadata; cannot validate headers.",
-                                stats={"char": c},
-                            )
-                        )
-                header_words, footer_words = split_header_footer_words(word_tokens, page_height)
-                header_text_snippet = words_to_snippet(header_words)
-                footer_text_snippet = words_to_snippet(footer_words)
-                if not header_words and not footer_words:
-                    raise RuntimeError(
-                        format_error(
-                            "HEADER_FOOTER_MISSING",
-                            page_num,
-                            "Missing header/footer content.",
-                        )
-                    )
-                scan_for_amendment_indicators(
-                    page_num, header_text_snippet, footer_text_snippet
-                )
-                page_entry["header_text_snippet"] = header_text_snippet
-                page_entry["footer_text_snippet"] = footer_text_snippet
-                is_toc_page = is_table_of_contents_header(header_text_snippet)
-                table_candidates, table_rotation_debug = extract_tables_with_rotation(
-                    page, word_tokens, page_num
-                )
-                for idx, c in enumerate(table_candidates, start=1):
-                    c["table_index"] = idx
-                table_ruled_filter: List[Dict] = []
-                real_tables = [
-                    c for c in table_candidates if is_real_ruled_table(c, page, table_ruled_filter)
-                ]
-                if table_rotation_debug.get("tie_breaker"):
-                    page_entry["warnings"].append(
-                        f"TABLE_ROTATION_TIE_DEFAULT PDF_PAGE={page_num} method={table_rotation_debug['tie_breaker']}"
-                    )
-                chosen_rotation = table_rotation_debug.get("chosen_rotation")
-                if chosen_rotation is None:
-                    chosen_rotation = 0
-                for c in table_candidates:
-                    c["is_real_ruled"] = any(rt is c for rt in real_tables)
-                tables = [c for c in real_tables if c["extraction"]["ok"]]
-                table_bboxes = [c["bbox"] for c in real_tables]
-                for idx, c in enumerate(table_candidates, start=1):
-                    extraction = c["extraction"]
-                    if not extraction["ok"]:
-                        warning = (
-                            f"TABLE_EXTRACTION_DEGENERATE PDF_PAGE={page_num} "
-                            f"bbox={list(c['bbox'])} reason={extraction['reason']}"
-                        )
-                        page_entry["warnings"].append(warning)
-                    page_entry["tables_found"].append(
-                        {
-                            "table_index": idx,
-                            "bbox": list(c["bbox"]),
-                            "rotation": c["rotation"],
-                            "intersection_count": c["intersection_count"],
-                            "confidence_reason": c["confidence_reason"],
-                            "extraction": {
-                                "ok": extraction["ok"],
-                                "row_count": extraction["row_count"],
-                                "col_count": extraction["col_count"],
-                                "empty_ratio": extraction["empty_ratio"],
-                                "reason": extraction["reason"],
-                            },
-                            "real_ruled": c.get("is_real_ruled", False),
-                        }
-                    )
-
-                chars_no_tables = [c for c in chars_all if not inside_any_table(c, table_bboxes)]
-                words_no_tables = [
-                    w for w in word_tokens if not inside_any_table(w, table_bboxes)
-                ]
-                if args.debug_dump:
-                    exclusion_debug = []
-                    for c in real_tables:
-                        bbox = c["bbox"]
-                        in_bbox = sum(
-                            1 for ch in chars_all if inside_any_table(ch, [bbox])
-                        )
-                        remaining = sum(
-                            1 for ch in chars_no_tables if inside_any_table(ch, [bbox])
-                        )
-                        exclusion_debug.append(
-                            {
-                                "table_index": c["table_index"],
-                                "bbox": list(bbox),
-                                "chars_in_bbox": in_bbox,
-                                "chars_excluded": max(0, in_bbox - remaining),
-                            }
-                        )
-                    page_entry["table_char_exclusion"] = exclusion_debug
-                body_chars = [
-                    c
-                    for c in chars_no_tables
-                    if (page_height * HEADER_REGION_RATIO)
-                    < c["top"]
-                    < page_height * (1.0 - FOOTER_REGION_RATIO)
-                ]
-                body_sizes = [
-                    c["size"] for c in body_chars if isinstance(c.get("size"), (int, float))
-                ]
-                if not body_sizes:
-                    warning = (
-                        f"NO_BODY_CONTENT PDF_PAGE={page_num} detail=No body chars in page body region."
-                    )
-                    page_entry["warnings"].append(warning)
-                    body_median_size = None
-                    ordered_lines = []
-                    column_bounds = {}
-                else:
-                    body_median_size = median(body_sizes)
-                    ordered_lines, column_bounds = build_ordered_lines(
-                        chars_no_tables,
-                        words_no_tables,
-                        page_width,
-                        page_height,
-                        page_num,
-                        body_median_size,
-                        table_bboxes,
-                        page_entry["column_split_debug"],
-                    )
-                    if not column_bounds:
-                        raise RuntimeError(
-                            format_error(
-                                "COLUMN_BOUNDS_MISSING",
-                                page_num,
-                                "Missing column bounds.",
-                            )
-                        )
-                    page_entry["column_bounds"] = column_bounds
-                    page_entry["spanning_reference_lines"] = [
-                        {
-                            "text": line["text"],
-                            "bbox": [
-                                line["x0"],
-                                line["top"],
-                                line.get("x1"),
-                                line.get("bottom"),
-                            ],
-                            "role": line.get("role"),
-                        }
-                        for line in ordered_lines
-                        if line.get("role") == "spanning_reference"
-                    ]
-                label_lines_original = build_label_lines(word_tokens, page_num)
-                rotated_label_lines = label_lines_original
-                if table_candidates:
-                    rotated_words = rotate_objects(
-                        word_tokens, page_width, page_height, chosen_rotation
-                    )
-                    rotated_label_lines = build_label_lines(rotated_words, page_num)
-                label_candidates = [
-                    {
-                        "text": line["text"],
-                        "top": line["top"],
-                        "x0": line["x0"],
-                        "x1": line.get("x1"),
-                        "column": line.get("column"),
-                    }
-                    for line in label_lines_original
-                    if TABLE_LABEL_RE.match(line["text"].strip())
-                ]
-                page_entry["thresholds"] = {
-                    "header_region_ratio": HEADER_REGION_RATIO,
-                    "footer_region_ratio": FOOTER_REGION_RATIO,
-                    "line_y_tolerance": LINE_Y_TOLERANCE,
-                    "column_margin_tolerance": COLUMN_MARGIN_TOLERANCE,
-                    "header_body_indent_min": HEADER_BODY_INDENT_MIN,
-                    "header_size_delta": HEADER_SIZE_DELTA,
-                    "max_header_line_gap": MAX_HEADER_LINE_GAP,
-                    "body_median_font_size": body_median_size,
-                    "spacing_thresholds": column_bounds.get("spacing_thresholds"),
-                    "margin_percentile": column_bounds.get("margin_percentile"),
-                    "table_edge_tolerance": TABLE_EDGE_TOLERANCE,
-                }
+                if layout["error"] is not None:
+                    raise layout["error"]
+                is_toc_page = layout["is_toc_page"]
+                tables = layout["tables"]
+                chosen_rotation = layout["chosen_rotation"]
+                ordered_lines = layout["ordered_lines"]
+                label_lines_original = layout["label_lines_original"]
+                rotated_label_lines = layout["rotated_label_lines"]
 
                 # Identify chapter changes.
                 for line in ordered_lines:
@@ -2739,8 +3057,14 @@ def main() -> int:
 
                 # Map table labels and extract table content atomically.
                 table_label_entries: List[Tuple[float, str]] = []
-                table_footnote_tops: List[float] = []
+                table_footnote_tops: Set[float] = set()
                 table_entries: List[Dict] = []
+                # Upper-cased TABLE labels on this page, only needed to judge a pending table.
+                table_label_uppers: List[str] = []
+                if pending_table:
+                    table_label_uppers = [
+                        line["_upper"] for line in label_lines_original if line["_is_table_label"]
+                    ]
 
                 # A bottom-touching table may continue, but only merge when continuation is provable.
                 # CANONICAL: table continuation logic (only merge when continuation is provable).
@@ -2749,9 +3073,7 @@ def main() -> int:
                         label_lines_original, pending_table["table_id"]
                     )
                     carryover_label_present = any(
-                        TABLE_LABEL_RE.match(line["text"].strip())
-                        and pending_table["table_id"] in line["text"].upper()
-                        for line in label_lines_original
+                        pending_table["table_id"] in upper for upper in table_label_uppers
                     )
                     if continued_marker_present:
                         raise RuntimeError(
@@ -2790,6 +3112,13 @@ def main() -> int:
                     tables_extracted += 1
                     pending_table = None
 
+                # Line indices sorted by top, so each table's footnote band is a bisect range.
+                line_order_by_top: List[int] = []
+                if tables:
+                    line_order_by_top = sorted(
+                        range(len(ordered_lines)), key=lambda i: ordered_lines[i]["top"]
+                    )
+                line_tops_sorted = [ordered_lines[i]["top"] for i in line_order_by_top]
                 for t in tables:
                     table_index = t["table_index"]
                     table_id, title, label_line, continued = find_table_label_for_bbox(
@@ -2802,7 +3131,12 @@ def main() -> int:
                         page_entry["warnings"].append(
                             f"TABLE_LABEL_MISSING PDF_PAGE={page_num} bbox={list(t['bbox'])}"
                         )
-                    base_id = re.sub(r"\(.*\)$", "", table_id).strip()
+                    # Label ids carry at most one trailing part, e.g. R301.2(1); drop it.
+                    paren_idx = table_id.find("(")
+                    if paren_idx >= 0 and table_id.endswith(")"):
+                        base_id = table_id[:paren_idx].strip()
+                    else:
+                        base_id = table_id.strip()
                     continued_from = None
                     if continued:
                         prior_id = last_table_id_by_base.get(base_id)
@@ -2848,13 +3182,16 @@ def main() -> int:
 
                     # Capture footnotes as lines just below the table bbox.
                     footnotes = []
-                    for line in ordered_lines:
-                        if t["bbox"][3] < line["top"] <= (t["bbox"][3] + 60):
-                            if line["text"].startswith(("*", "a.", "b.", "c.", "For SI:")):
-                                footnotes.append(line["text"])
-                                table_footnote_tops.append(line["top"])
-
-                    touches_bottom = t["bbox"][3] >= page.height - 15
+                    band_start = bisect_right(line_tops_sorted, t["bbox"][3])
+                    band_end = bisect_right(line_tops_sorted, t["bbox"][3] + 60)
+                    # Back in ordered_lines order, which is the footnote reading order.
+                    for i in sorted(line_order_by_top[band_start:band_end]):
+                        line = ordered_lines[i]
+                        if line["text"].startswith(("*", "a.", "b.", "c.", "For SI:")):
+                            footnotes.append(line["text"])
+                            table_footnote_tops.add(line["top"])
+
+                    touches_bottom = t["bbox"][3] >= page_height - 15
                     table_entries.append(
                         {
                             "table_id": table_id,
@@ -2886,17 +3223,16 @@ def main() -> int:
                         label_lines_original, pending_table["table_id"]
                     )
                     carryover_label = any(
-                        TABLE_LABEL_RE.match(line["text"].strip())
-                        and pending_table["table_id"] in line["text"].upper()
-                        for line in label_lines_original
+                        pending_table["table_id"] in upper for upper in table_label_uppers
                     )
-                    continuation_matches = []
+                    # (entry, header_matches) pairs; the column comparison is reused for the debug record.
+                    continuation_matches: List[Tuple[Dict, bool]] = []
                     for entry in table_entries:
                         if entry["table_id"] != pending_table["table_id"]:
                             continue
                         header_matches = entry["columns"] == pending_table["columns"]
                         if continued_marker or (header_matches and carryover_label):
-                            continuation_matches.append(entry)
+                            continuation_matches.append((entry, header_matches))
 
                     if continued_marker and not continuation_matches:
                         raise RuntimeError(
@@ -2912,12 +3248,12 @@ def main() -> int:
                                 "TABLE_CONTINUATION",
                                 page_num,
                                 f"Multiple continuation matches for TABLE {pending_table['table_id']}.",
-                                stats={"matches": [m["table_id"] for m in continuation_matches]},
+                                stats={"matches": [m["table_id"] for m, _ in continuation_matches]},
                             )
                         )
 
                     if continuation_matches:
-                        entry = continuation_matches[0]
+                        entry, header_matches = continuation_matches[0]
                         if pending_table.get("metadata") and pending_table["metadata"].get(
                             "rotation"
                         ) != entry["rotation"]:
@@ -2945,7 +3281,7 @@ def main() -> int:
                                 "decision": "merged_continuation",
                                 "page": page_num,
                                 "continued_marker": continued_marker,
-                                "header_matches": entry["columns"] == pending_table["columns"],
+                                "header_matches": header_matches,
                                 "carryover_label": carryover_label,
                             }
                         )
@@ -3045,65 +3381,57 @@ def main() -> int:
                     tables_extracted += 1
 
                 if args.debug_dump:
-                    rotation_results = []
-                    for r in table_rotation_debug.get("rotation_results", []):
-                        rotation_results.append(
-                            {
-                                "rotation": r["rotation"],
-                                "total_intersections": r["total_intersections"],
-                                "total_area": r["total_area"],
-                                "orientation_score": r.get("orientation_score"),
-                                "orientation_target": r.get("orientation_target"),
-                                "h_line_count": r["h_line_count"],
-                                "v_line_count": r["v_line_count"],
-                                "candidate_count": len(r["candidates"]),
-                            }
-                        )
                     table_debug_payload = {
                         "pdf_page": page_num,
                         "chosen_rotation": chosen_rotation,
-                        "rotation_results": rotation_results,
+                        "rotation_results": layout["rotation_results"],
                         "tables": page_entry.get("tables_found"),
-                        "ruled_filter": table_ruled_filter,
+                        "ruled_filter": layout["table_ruled_filter"],
                     }
-                    (debug_dir / f"debug_tables_page_{page_num}.json").write_text(
-                        json.dumps(table_debug_payload, indent=2), encoding="utf-8"
+                    write_debug_json(
+                        debug_dir / f"debug_tables_page_{page_num}.json", table_debug_payload
                     )
-                    if table_candidates:
-                        img = page.to_image(resolution=150)
-                        img.draw_rects([c["bbox"] for c in table_candidates], stroke="red")
-                        img.save(debug_dir / f"debug_tables_page_{page_num}.png")
+                    if layout["table_debug_png"] is not None:
+                        write_output_bytes(
+                            debug_dir / f"debug_tables_page_{page_num}.png",
+                            layout["table_debug_png"],
+                        )
 
                 page_entry["table_label_bindings"] = table_label_bindings
                 page_entry["table_continuation"] = table_continuation_debug
                 page_entry["section_candidates"] = section_debug
 
-                fallback_lines: List[str] = []
-                for line in ordered_lines:
-                    if line.get("role") == "spanning_reference":
-                        continue
-                    is_label_line = any(
+                # Bound table labels, looked up by exact text, then matched by top tolerance.
+                label_tops_by_text: Dict[str, List[float]] = {}
+                for label_top, label_text in table_label_entries:
+                    label_tops_by_text.setdefault(label_text, []).append(label_top)
+                label_line_ids = {
+                    id(line)
+                    for line in ordered_lines
+                    if any(
                         abs(line["top"] - label_top) <= LINE_Y_TOLERANCE
-                        and line["text"] == label_text
-                        for label_top, label_text in table_label_entries
+                        for label_top in label_tops_by_text.get(line["text"], ())
                     )
-                    if is_label_line or line["top"] in table_footnote_tops:
-                        continue
-                    fallback_lines.append(line["text"])
-                fallback_pages[page_num] = fallback_lines
+                }
+
+                fallback_pages[page_num] = [
+                    line["text"]
+                    for line in ordered_lines
+                    if line.get("role") != "spanning_reference"
+                    and id(line) not in label_line_ids
+                    and line["top"] not in table_footnote_tops
+                ]
 
                 # Build section text, excluding table labels and footnotes.
                 for idx, line in enumerate(ordered_lines):
                     if is_toc_page:
                         continue
-                    candidate_id = parse_true_section_heading(line["text"])
-                    marker_id = parse_section_marker_line(line["text"])
+                    text = line["text"]
+                    marker_id = parse_section_marker_line(text)
                     if marker_id:
                         if section_stack:
                             entry = section_stack.pop()
-                            pdf_pages = list(
-                                range(entry["start_page"], entry["end_page"] + 1)
-                            )
+                            pdf_pages = range(entry["start_page"], entry["end_page"] + 1)
                             write_section(
                                 entry["id"],
                                 entry["chapter"],
@@ -3112,23 +3440,20 @@ def main() -> int:
                             )
                             sections_extracted += 1
                         continue
-                    is_label_line = any(
-                        abs(line["top"] - label_top) <= LINE_Y_TOLERANCE
-                        and line["text"] == label_text
-                        for label_top, label_text in table_label_entries
+                    candidate_id = parse_true_section_heading(text)
+                    is_excluded = (
+                        line.get("role") == "spanning_reference"
+                        or id(line) in label_line_ids
+                        or line["top"] in table_footnote_tops
                     )
                     if candidate_id:
-                        if (
-                            line.get("role") == "spanning_reference"
-                            or is_label_line
-                            or line["top"] in table_footnote_tops
-                        ):
+                        if is_excluded:
                             raise RuntimeError(
                                 format_error(
                                     "SECTION_HEADER_SKIPPED",
                                     page_num,
                                     "Section header line excluded from section text.",
-                                    stats={"text": line["text"]},
+                                    stats={"text": text},
                                 )
                             )
                         if section_stack and candidate_id == section_stack[-1]["id"]:
@@ -3136,23 +3461,19 @@ def main() -> int:
                                 "SECTION_APPEND_VIOLATION: header text appended to previous section"
                             )
                         new_depth = section_id_depth(candidate_id)
-                        if section_stack:
-                            while (
-                                section_stack
-                                and new_depth <= section_stack[-1]["depth"]
-                                and candidate_id != section_stack[-1]["id"]
-                            ):
-                                entry = section_stack.pop()
-                                pdf_pages = list(
-                                    range(entry["start_page"], entry["end_page"] + 1)
-                                )
-                                write_section(
-                                    entry["id"],
-                                    entry["chapter"],
-                                    pdf_pages,
-                                    entry["lines"],
-                                )
-                                sections_extracted += 1
+                        while section_stack:
+                            entry = section_stack[-1]
+                            if new_depth > entry["depth"] or candidate_id == entry["id"]:
+                                break
+                            section_stack.pop()
+                            pdf_pages = range(entry["start_page"], entry["end_page"] + 1)
+                            write_section(
+                                entry["id"],
+                                entry["chapter"],
+                                pdf_pages,
+                                entry["lines"],
+                            )
+                            sections_extracted += 1
                         if candidate_id in section_occurrences:
                             prev_pdf = section_occurrences[candidate_id]
                             raise RuntimeError(
@@ -3170,70 +3491,62 @@ def main() -> int:
                             {
                                 "id": candidate_id,
                                 "depth": new_depth,
-                                "lines": [line["text"]],
+                                "lines": [text],
                                 "start_page": page_num,
                                 "end_page": page_num,
                                 "chapter": current_chapter,
                             }
                         )
                         continue
-                    if line.get("role") == "spanning_reference":
-                        continue
-                    if is_label_line or line["top"] in table_footnote_tops:
+                    if is_excluded:
                         continue
 
                     if section_stack:
-                        section_stack[-1]["lines"].append(line["text"])
-                        section_stack[-1]["end_page"] = page_num
+                        entry = section_stack[-1]
+                        entry["lines"].append(text)
+                        entry["end_page"] = page_num
             except Exception as exc:
                 error_message = ensure_error_context(str(exc), page_num)
                 page_entry["errors"].append(error_message)
                 if args.debug_dump:
-                    debug_payload = {
-                        "pdf_page": page_num,
-                        "header_text_snippet": header_text_snippet,
-                        "footer_text_snippet": footer_text_snippet,
-                        "warnings": page_entry["warnings"],
-                        "column_bounds": column_bounds or None,
-                        "thresholds": page_entry.get("thresholds"),
-                        "spanning_reference_lines": page_entry.get("spanning_reference_lines"),
-                        "table_label_candidates": label_candidates,
-                        "table_label_bindings": table_label_bindings,
-                        "table_continuation": table_continuation_debug,
-                        "column_split_debug": page_entry.get("column_split_debug"),
-                        "tables_found": page_entry.get("tables_found"),
-                        "section_candidates": section_debug,
-                        "errors": page_entry["errors"],
-                    }
-                    (debug_dir / f"page_{page_num}.json").write_text(
-                        json.dumps(debug_payload, indent=2), encoding="utf-8"
+                    debug_payload = build_page_debug_payload(
+                        page_num,
+                        page_entry,
+                        header_text_snippet,
+                        footer_text_snippet,
+                        column_bounds,
+                        label_candidates,
+                        table_label_bindings,
+                        table_continuation_debug,
+                        section_debug,
+                        include_errors=True,
                     )
+                    write_debug_json(debug_dir / f"page_{page_num}.json", debug_payload)
                 report["pages"].append(page_entry)
-                write_report(report_path, report)
-                raise RuntimeError(error_message) from exc
+                page_error = (error_message, exc)
+                break
 
             if args.debug_dump:
-                debug_payload = {
-                    "pdf_page": page_num,
-                    "header_text_snippet": header_text_snippet,
-                    "footer_text_snippet": footer_text_snippet,
-                    "warnings": page_entry["warnings"],
-                    "column_bounds": column_bounds or None,
-                    "thresholds": page_entry.get("thresholds"),
-                    "spanning_reference_lines": page_entry.get("spanning_reference_lines"),
-                    "table_label_candidates": label_candidates,
-                    "table_label_bindings": table_label_bindings,
-                    "table_continuation": table_continuation_debug,
-                    "column_split_debug": page_entry.get("column_split_debug"),
-                    "tables_found": page_entry.get("tables_found"),
-                    "section_candidates": section_debug,
-                }
-                (debug_dir / f"page_{page_num}.json").write_text(
-                    json.dumps(debug_payload, indent=2), encoding="utf-8"
+                debug_payload = build_page_debug_payload(
+                    page_num,
+                    page_entry,
+                    header_text_snippet,
+                    footer_text_snippet,
+                    column_bounds,
+                    label_candidates,
+                    table_label_bindings,
+                    table_continuation_debug,
+                    section_debug,
                 )
+                write_debug_json(debug_dir / f"page_{page_num}.json", debug_payload)
             report["pages"].append(page_entry)
 
+        # Written once, whether the loop finished or stopped at a failing page.
         write_report(report_path, report)
+        if page_error is not None:
+            page_layouts.close()
+            error_message, exc = page_error
+            raise RuntimeError(error_message) from exc
 
         # Flush final section.
         if pending_table:
@@ -3247,7 +3560,7 @@ def main() -> int:
 
         while section_stack:
             entry = section_stack.pop()
-            pdf_pages = list(range(entry["start_page"], entry["end_page"] + 1))
+            pdf_pages = range(entry["start_page"], entry["end_page"] + 1)
             write_section(
                 entry["id"],
                 entry["chapter"],
@@ -3255,10 +3568,13 @@ def main() -> int:
                 entry["lines"],
             )
             sections_extracted += 1
+        # The integrity check reads the section files back.
+        flush_output_writes()
         enforce_section_integrity(list(section_occurrences.keys()), OUTPUT_DIR)
         if sections_extracted == 0:
-            for page_num in sorted(fallback_pages.keys()):
-                write_fallback_page(page_num, fallback_pages[page_num])
+            # Filled in page order by the page loop, so insertion order is already sorted.
+            for page_num, lines in fallback_pages.items():
+                write_fallback_page(page_num, lines)
 
     print(f"Sections extracted: {sections_extracted}")
     print(f"Tables extracted: {tables_extracted}")